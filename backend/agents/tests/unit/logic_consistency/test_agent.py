@@ -0,0 +1,46 @@
+"""Unit tests for the LogicConsistency routing agent."""
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.logic_consistency.agent import (
+    LogicConsistencyAgent,
+    logic_consistency_agent,
+)
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.logic_consistency.sub_agents import (
+    fast_path_agent,
+)
+
+
+def _make_agent(max_chars: int) -> LogicConsistencyAgent:
+    return logic_consistency_agent.clone(update={"fast_path_max_chars": max_chars})
+
+
+class TestRouting:
+    """Test the choice between the full pipeline and the fast path."""
+
+    def test_fast_path_disabled_by_default(self):
+        assert logic_consistency_agent.fast_path_max_chars == 0
+        agent = logic_consistency_agent._select_agent("short doc")
+        assert agent is logic_consistency_agent.full_pipeline
+
+    def test_short_document_uses_fast_path(self):
+        agent = _make_agent(100)
+        assert agent._select_agent("short doc").name == fast_path_agent.name
+
+    def test_long_document_uses_full_pipeline(self):
+        agent = _make_agent(5)
+        assert agent._select_agent("a much longer doc").name == (
+            "LogicConsistencyPipeline"
+        )
+
+    def test_empty_document_uses_full_pipeline(self):
+        agent = _make_agent(100)
+        assert agent._select_agent("").name == "LogicConsistencyPipeline"
+
+
+class TestWiring:
+    """Test the module-level agent configuration."""
+
+    def test_agent_name_is_selectable_name(self):
+        assert logic_consistency_agent.name == "LogicConsistency"
+
+    def test_fast_path_writes_reviewer_output_key(self):
+        assert fast_path_agent.output_key == "logic_consistency_reviewer_output"
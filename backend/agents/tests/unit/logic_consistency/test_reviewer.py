@@ -3,11 +3,16 @@
 from unittest.mock import MagicMock
 
 from google.adk.agents import LlmAgent
+from google.adk.models.google_llm import Gemini
 from google.adk.models.llm_request import LlmRequest
+from google.adk.planners.built_in_planner import BuiltInPlanner
 from google.genai import types
 
+from veritas_ai_agent.shared.model_name_config import GEMINI_FLASH
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.logic_consistency.sub_agents.reviewer.agent import (
+    _aggregate_reviewed_findings,
     _create_reviewer_agent,
+    _dedupe_findings,
     _prepare_work_items,
     reviewer_agent,
 )
@@ -193,6 +198,24 @@ class TestPrepareWorkItems:
         mock_output.model_dump.assert_called_once()
         assert len(batches) == 1
 
+    def test_drops_duplicate_findings(self):
+        findings = _make_findings(2)
+        duplicate = dict(findings[0], fsli_name=" fsli_0 ", claim="CLAIM   0")
+        state = {
+            "logic_consistency_detector_output": {"findings": [*findings, duplicate]}
+        }
+        batches = _prepare_work_items(state)
+
+        assert len(batches) == 1
+        assert batches[0] == findings
+
+    def test_dedupe_keeps_same_claim_on_different_fsli(self):
+        findings = _make_findings(2)
+        findings[1]["claim"] = findings[0]["claim"]
+        state = {"logic_consistency_detector_output": {"findings": findings}}
+
+        assert _prepare_work_items(state) == [findings]
+
 
 # --- _create_reviewer_agent Tests ---
 
@@ -217,9 +240,10 @@ class TestCreateReviewerAgent:
         agent = _create_reviewer_agent(0, _make_findings(1), "key")
         assert agent.include_contents == "none"
 
-    def test_before_model_callback_is_strip_injected_context(self):
+    def test_before_model_callback_strips_injected_context_first(self):
         agent = _create_reviewer_agent(0, _make_findings(1), "key")
-        assert agent.before_model_callback is strip_injected_context
+        assert isinstance(agent.before_model_callback, list)
+        assert agent.before_model_callback[0] is strip_injected_context
 
     def test_instruction_contains_batch_findings(self):
         batch = [{"fsli_name": "Revenue", "claim": "test claim"}]
@@ -228,6 +252,45 @@ class TestCreateReviewerAgent:
         assert "Revenue" in agent.instruction
         assert "test claim" in agent.instruction
 
+    def test_uses_flash_with_low_thinking_by_default(self):
+        agent = _create_reviewer_agent(0, _make_findings(1), "key")
+        assert isinstance(agent.model, Gemini)
+        assert agent.model.model == GEMINI_FLASH
+        assert isinstance(agent.planner, BuiltInPlanner)
+        assert agent.planner.thinking_config.thinking_level == types.ThinkingLevel.LOW
+
+    def test_thinking_level_scales_with_batch_complexity(self):
+        medium = [{"reasoning": "r" * 1500, "contradiction": "c" * 500}]
+        high = [{"reasoning": "r" * 2500, "contradiction": "c" * 1000}]
+        medium_agent = _create_reviewer_agent(0, medium, "key")
+        high_agent = _create_reviewer_agent(0, high, "key")
+
+        assert isinstance(medium_agent.planner, BuiltInPlanner)
+        assert isinstance(high_agent.planner, BuiltInPlanner)
+        medium_level = medium_agent.planner.thinking_config.thinking_level
+        high_level = high_agent.planner.thinking_config.thinking_level
+        assert medium_level == types.ThinkingLevel.MEDIUM
+        assert high_level == types.ThinkingLevel.HIGH
+
+    def test_planner_shared_between_batches_of_same_level(self):
+        first = _create_reviewer_agent(0, _make_findings(1), "key_0")
+        second = _create_reviewer_agent(1, _make_findings(1), "key_1")
+        assert first.planner is second.planner
+        assert first.generate_content_config is second.generate_content_config
+
+    def test_agents_do_not_share_mutable_state(self):
+        first = _create_reviewer_agent(0, _make_findings(1), "key_0")
+        second = _create_reviewer_agent(1, _make_findings(1), "key_1")
+        assert first is not second
+        assert first.output_key == "key_0"
+        assert second.output_key == "key_1"
+        assert first.parent_agent is None
+
+    def test_agents_share_model_client(self):
+        first = _create_reviewer_agent(0, _make_findings(1), "key_0")
+        second = _create_reviewer_agent(1, _make_findings(1), "key_1")
+        assert first.model is second.model
+
     def test_instruction_does_not_contain_other_findings(self):
         """Instruction should only contain the batch findings, not all findings."""
         batch = [{"fsli_name": "Revenue", "claim": "batch claim"}]
@@ -264,6 +327,45 @@ class TestFanOutAgentWiring:
         assert reviewer_agent.config.prepare_work_items is _prepare_work_items
         assert reviewer_agent.config.create_agent is _create_reviewer_agent
 
-    def test_no_custom_aggregate(self):
+    def test_aggregate_dedupes_findings(self):
         assert reviewer_agent.config is not None
-        assert reviewer_agent.config.aggregate is None
+        assert reviewer_agent.config.aggregate is _aggregate_reviewed_findings
+
+
+# --- _aggregate_reviewed_findings Tests ---
+
+
+class TestAggregateReviewedFindings:
+    """Test the post-merge dedupe of reviewed findings."""
+
+    def test_concatenates_unique_findings(self):
+        findings = _make_findings(3)
+        outputs = [{"findings": findings[:2]}, {"findings": findings[2:]}]
+        assert _aggregate_reviewed_findings(outputs) == {"findings": findings}
+
+    def test_keeps_highest_severity_duplicate(self):
+        low = dict(_make_findings(1)[0], severity="low")
+        high = dict(low, fsli_name="fsli_0", severity="high")
+        medium = dict(low, severity="medium")
+        outputs = [{"findings": [low]}, {"findings": [high]}, {"findings": [medium]}]
+
+        result = _aggregate_reviewed_findings(outputs)
+
+        assert result == {"findings": [high]}
+
+    def test_handles_empty_outputs(self):
+        assert _aggregate_reviewed_findings([]) == {"findings": []}
+
+    def test_keeps_distinct_claims_with_long_shared_prefix(self):
+        prefix = "Revenue growth in the MD&A contradicts the income statement " * 2
+        first = dict(_make_findings(1)[0], fsli_name="Revenue", claim=prefix + "A")
+        second = dict(first, claim=prefix + "B")
+        assert len(prefix) > 100
+        # Both survive the pre-review dedupe, so both must survive the merge
+        assert _dedupe_findings([first, second]) == [first, second]
+
+        result = _aggregate_reviewed_findings(
+            [{"findings": [first]}, {"findings": [second]}]
+        )
+
+        assert result == {"findings": [first, second]}
@@ -271,7 +271,9 @@ class TestCreateAgent:
         batch = [{"table_index": 0}]
         agent = create_agent(0, batch, "key")
 
-        expected_json = json.dumps({"tables": batch}, indent=2)
+        expected_json = json.dumps(
+            {"tables": batch}, separators=(",", ":"), ensure_ascii=False
+        )
         assert expected_json in agent.instruction
 
     def test_agent_name_includes_index(self):
@@ -0,0 +1,136 @@
+"""Unit tests for the cross-table detector factory."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.sub_agents.detectors import (
+    prompt,
+)
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.sub_agents.detectors.agent import (
+    _dedup_findings,
+    create_cross_table_detector,
+)
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.sub_agents.detectors.schema import (
+    CrossTableFinding,
+)
+
+
+def _extract_findings():
+    agent = create_cross_table_detector(
+        agent_name="TestDetector",
+        output_key="test_output",
+        first_pass_instruction="first",
+        refinement_instruction="refine",
+    )
+    return agent.config.extract_findings
+
+
+def _finding(name: str) -> CrossTableFinding:
+    return CrossTableFinding(
+        fsli_name=name,
+        statement_type="Balance Sheet",
+        discrepancy="mismatch",
+        reasoning="because",
+        source_refs=["Table 1"],
+    )
+
+
+class TestExtractFindings:
+    def test_dict_findings_returned_as_is(self):
+        findings = [{"fsli_name": "Cash"}]
+        assert _extract_findings()({"findings": findings}) is findings
+
+    def test_model_findings_are_dumped(self):
+        result = _extract_findings()({"findings": [_finding("Cash")]})
+        assert result == [_finding("Cash").model_dump()]
+
+    def test_missing_findings(self):
+        assert _extract_findings()({}) == []
+
+
+class TestPromptPrefixes:
+    @pytest.mark.parametrize("statement", ["BS", "IS", "CF"])
+    def test_refinement_extends_first_pass(self, statement):
+        first_pass = getattr(prompt, f"{statement}_FIRST_PASS_INSTRUCTION")
+        refinement = getattr(prompt, f"{statement}_REFINEMENT_INSTRUCTION")
+        assert refinement.startswith(first_pass)
+        assert "_chain_CHAIN_IDX_accumulated_findings}" in refinement
+
+    def test_statement_types_share_tables_prefix(self):
+        prefix = prompt.BS_FIRST_PASS_INSTRUCTION.split("### Statement Type")[0]
+        assert prefix.rstrip().endswith("{extracted_tables_compact}")
+        assert prompt.IS_FIRST_PASS_INSTRUCTION.startswith(prefix)
+        assert prompt.CF_FIRST_PASS_INSTRUCTION.startswith(prefix)
+
+    def test_static_instruction_has_no_placeholders(self):
+        assert "{" not in prompt.DETECTOR_STATIC_INSTRUCTION
+
+
+def _finding_dict(**overrides) -> dict:
+    return {**_finding("Cash").model_dump(), **overrides}
+
+
+class TestAggregatorDedup:
+    def test_exact_duplicates_merged(self):
+        findings = [
+            _finding_dict(source_refs=["Table 1"]),
+            _finding_dict(
+                fsli_name=" cash ",
+                reasoning="longer reasoning",
+                source_refs=["Table 2", "Table 1"],
+            ),
+        ]
+
+        result = _dedup_findings(findings)
+
+        assert len(result) == 1
+        assert result[0]["reasoning"] == "longer reasoning"
+        assert result[0]["source_refs"] == ["Table 1", "Table 2"]
+
+    def test_distinct_findings_kept(self):
+        findings = [_finding_dict(), _finding_dict(discrepancy="other mismatch")]
+        assert _dedup_findings(findings) == findings
+
+    def test_detector_dedups_findings_before_aggregation(self):
+        agent = create_cross_table_detector(
+            agent_name="TestDetector",
+            output_key="test_output",
+            first_pass_instruction="first",
+            refinement_instruction="refine",
+        )
+        assert agent.config.transform_findings is _dedup_findings
+
+    def test_instruction_embeds_findings_verbatim(self):
+        instruction = prompt.get_aggregator_instruction("FINDINGS_JSON")
+        assert "FINDINGS_JSON" in instruction
+        assert "{findings_placeholder}" not in instruction
+
+
+class TestPassInstruction:
+    def _provider(self, chain_idx: int = 0):
+        agent = create_cross_table_detector(
+            agent_name="TestDetector",
+            output_key="test_output",
+            first_pass_instruction="Tables: {extracted_tables_compact}",
+            refinement_instruction=(
+                "Tables: {extracted_tables_compact}\n"
+                "Previous: {TestDetector_chain_CHAIN_IDX_accumulated_findings}"
+            ),
+        )
+        return agent.config.chain_agent_config.get_instruction(chain_idx)
+
+    def test_first_pass_renders_state(self):
+        ctx = MagicMock()
+        ctx.session.state = {"extracted_tables_compact": '{"tables":[]}'}
+
+        assert self._provider()(ctx) == 'Tables: {"tables":[]}'
+
+    def test_refinement_renders_chain_findings(self):
+        ctx = MagicMock()
+        ctx.session.state = {
+            "extracted_tables_compact": "T",
+            "TestDetector_chain_1_accumulated_findings": ["f"],
+        }
+
+        assert self._provider(1)(ctx) == "Tables: T\nPrevious: ['f']"
@@ -0,0 +1,56 @@
+"""Unit tests for the cross-table pipeline callbacks."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.callbacks import (
+    skip_without_multiple_tables,
+    store_compact_tables,
+)
+
+
+def _mock_ctx(state: dict) -> MagicMock:
+    ctx = MagicMock()
+    ctx.state = state
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_runs_with_two_tables():
+    state = {"extracted_tables": {"tables": [{"table_index": 0}, {"table_index": 1}]}}
+
+    assert await skip_without_multiple_tables(_mock_ctx(state)) is None
+    assert "cross_table_reviewer_output" not in state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tables", [[], [{"table_index": 0}]])
+async def test_skips_with_fewer_than_two_tables(tables):
+    state = {"extracted_tables": {"tables": tables}}
+
+    result = await skip_without_multiple_tables(_mock_ctx(state))
+
+    assert result is not None
+    assert state["cross_table_reviewer_output"] == {"findings": []}
+
+
+@pytest.mark.asyncio
+async def test_skips_without_extracted_tables():
+    state: dict = {}
+
+    assert await skip_without_multiple_tables(_mock_ctx(state)) is not None
+
+
+@pytest.mark.asyncio
+async def test_store_compact_tables():
+    grid = [["", "1"], ["1", 10.0]]
+    state = {
+        "extracted_tables": {
+            "tables": [{"table_index": 0, "table_name": "BS", "grid": grid}]
+        }
+    }
+
+    assert await store_compact_tables(_mock_ctx(state)) is None
+    assert state["extracted_tables_compact"].startswith("#### Table 0: BS\n")
+    assert "| 1 | 10 |" in state["extracted_tables_compact"]
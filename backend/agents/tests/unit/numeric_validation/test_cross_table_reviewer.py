@@ -0,0 +1,62 @@
+"""Unit tests for the cross-table reviewer work-item preparation."""
+
+from unittest.mock import patch
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.sub_agents.reviewer import (
+    agent as reviewer_module,
+)
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.sub_agents.reviewer.agent import (
+    _batch_size_from_env,
+    _create_reviewer_agent,
+    _prepare_work_items,
+)
+
+# --- _batch_size_from_env Tests ---
+
+
+class TestBatchSizeFromEnv:
+    def test_default(self, monkeypatch):
+        monkeypatch.delenv("CROSS_TABLE_REVIEWER_BATCH_SIZE", raising=False)
+        assert _batch_size_from_env() == 15
+
+    def test_malformed_value_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("CROSS_TABLE_REVIEWER_BATCH_SIZE", "ten")
+        assert _batch_size_from_env() == 15
+
+    def test_value_is_clamped(self, monkeypatch):
+        monkeypatch.setenv("CROSS_TABLE_REVIEWER_BATCH_SIZE", "0")
+        assert _batch_size_from_env() == 1
+        monkeypatch.setenv("CROSS_TABLE_REVIEWER_BATCH_SIZE", "5000")
+        assert _batch_size_from_env() == 100
+
+
+# --- _prepare_work_items Tests ---
+
+
+class TestPrepareWorkItems:
+    def test_empty_state_returns_no_batches(self):
+        assert _prepare_work_items({}) == []
+
+    def test_batches_span_all_detectors(self):
+        state = {
+            "balance_sheet_cross_table_inconsistency_detector_output": {
+                "findings": [{"id": 1}, {"id": 2}]
+            },
+            "cash_flow_cross_table_inconsistency_detector_output": {
+                "findings": [{"id": 3}]
+            },
+        }
+        with patch.object(reviewer_module, "_FINDINGS_BATCH_SIZE", 2):
+            batches = _prepare_work_items(state)
+        assert batches == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+
+# --- _create_reviewer_agent Tests ---
+
+
+class TestCreateReviewerAgent:
+    def test_batches_share_planner_and_generate_config(self):
+        first = _create_reviewer_agent(0, [{"id": 1}], "key_0")
+        second = _create_reviewer_agent(1, [{"id": 2}], "key_1")
+        assert first.planner is second.planner
+        assert first.generate_content_config is second.generate_content_config
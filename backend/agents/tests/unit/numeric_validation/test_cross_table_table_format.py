@@ -0,0 +1,35 @@
+"""Unit tests for the compact cross-table table rendering."""
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.cross_table_pipeline.table_format import (
+    format_tables_compact,
+)
+
+
+def _table(index: int, grid: list[list]) -> dict:
+    return {"table_index": index, "table_name": f"Name {index}", "grid": grid}
+
+
+def test_renders_markdown_grid():
+    grid = [["", "1", "2"], ["1", "Cash", 1500.0], ["2", "Debt", -20.5]]
+
+    assert format_tables_compact([_table(0, grid)]) == (
+        "#### Table 0: Name 0\n"
+        "|  | 1 | 2 |\n"
+        "|---|---|---|\n"
+        "| 1 | Cash | 1500 |\n"
+        "| 2 | Debt | -20.5 |"
+    )
+
+
+def test_tables_separated_by_blank_line():
+    result = format_tables_compact([_table(0, [["a"]]), _table(1, [["b"]])])
+    assert "|---|\n\n#### Table 1: Name 1" in result
+
+
+def test_none_and_pipes_escaped():
+    result = format_tables_compact([_table(0, [["a|b", None]])])
+    assert "| a\\|b |  |" in result
+
+
+def test_no_tables():
+    assert format_tables_compact([]) == ""
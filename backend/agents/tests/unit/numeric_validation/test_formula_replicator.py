@@ -11,6 +11,8 @@ Tests cover:
 from typing import ClassVar
 
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.formula_replicator import (
+    NumericMasks,
+    iter_replicated_formulas,
     replicate_formulas,
 )
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.schema import (
@@ -132,6 +134,31 @@ class TestVerticalReplication:
         assert 3 in cols  # Forward replication
         assert 1 not in cols  # No backward replication
 
+    def test_sum_col_ragged_span(self):
+        """A short row in the span should not hide columns numeric elsewhere."""
+        grid = [
+            ["Item", "2024", "2023", "2022", "2021"],
+            ["Revenue", 100, 95, 90, 85],
+            ["Cost", 40, 38],  # Ragged: extraction dropped the last cells
+            ["Profit", 60, 57, 54, 49],
+        ]
+        table_grids = {0: grid}
+
+        anchor = HorizontalVerticalCheckInferredFormula(
+            target_cell=TargetCell(table_index=0, row_index=3, col_index=1),
+            formula="sum_col(0, 1, 1, 2)",
+        )
+
+        result = replicate_formulas([anchor], table_grids, direction="vertical")
+
+        formulas_by_col = {r.target_cell.col_index: r.formula for r in result}
+        assert formulas_by_col == {
+            1: "sum_col(0, 1, 1, 2)",
+            2: "sum_col(0, 2, 1, 2)",
+            3: "sum_col(0, 3, 1, 2)",
+            4: "sum_col(0, 4, 1, 2)",
+        }
+
     def test_sum_cells_vertical(self):
         """Replicate vertical sum_cells formula."""
         grid = [
@@ -339,6 +366,78 @@ class TestEdgeCases:
         result = replicate_formulas([], {0: [[1, 2], [3, 4]]})
         assert result == []
 
+    def test_iter_yields_same_items_lazily(self):
+        """The lazy variant yields the original first and matches the list."""
+        grid = [["Item", "2024", "2023"], ["A", 1, 2], ["B", 3, 4], ["Sum", 4, 6]]
+        anchor = HorizontalVerticalCheckInferredFormula(
+            target_cell=TargetCell(table_index=0, row_index=3, col_index=1),
+            formula="sum_col(0, 1, 1, 2)",
+        )
+
+        stream = iter_replicated_formulas([anchor], {0: grid})
+
+        assert next(stream).formula == "sum_col(0, 1, 1, 2)"
+        assert [anchor.formula, *(r.formula for r in stream)] == [
+            r.formula for r in replicate_formulas([anchor], {0: grid})
+        ]
+
+    def test_numeric_masks_built_lazily(self):
+        """Masks are built per table on first access; missing grids map to None."""
+        grid = [["Item", "2024"], ["Revenue", 100.0], ["Audited", True]]
+        masks = NumericMasks({0: grid, 1: []})
+
+        assert masks == {}
+        assert masks[0] == [[False, False], [False, True], [False, False]]
+        assert masks[1] is None
+        assert masks[7] is None
+        assert set(masks) == {0, 1, 7}
+
+    def test_numeric_columns_memoized_per_span(self):
+        """The per-span column flags are computed once and shared."""
+        grid = [["Item", "2024", "Note"], ["Revenue", 100, "x"], ["Cost", "-", 5]]
+        masks = NumericMasks({0: grid})
+
+        first = masks.numeric_columns(0, 1, 2)
+
+        assert first == [False, True, True]
+        assert masks.numeric_columns(0, 1, 2) is first
+        assert masks.numeric_columns(0, 1, 1) == [False, True, False]
+
+    def test_row_bits(self):
+        """Each row becomes a bitmap of its numeric columns."""
+        grid = [["Item", "2024", "2023"], ["Revenue", 100, 90.5], ["Cost", "-", 5]]
+        masks = NumericMasks({0: grid})
+
+        assert masks.row_bits(0) == [0b000, 0b110, 0b100]
+
+    def test_out_of_range_column_index(self):
+        """A huge column index from the model is clamped to the table width."""
+        grid = [
+            ["Item", "Q1", "Q2", "Total"],
+            ["Revenue", 100, 95, 195],
+            ["Cost", 40, 38, 78],
+        ]
+        huge = 99999999999
+        anchors = [
+            HorizontalVerticalCheckInferredFormula(
+                target_cell=TargetCell(table_index=0, row_index=1, col_index=3),
+                formula=f"sum_row(0, 1, 1, {huge})",
+            ),
+            HorizontalVerticalCheckInferredFormula(
+                target_cell=TargetCell(table_index=0, row_index=1, col_index=3),
+                formula=f"sum_cells((0, 1, 1), (0, 1, {huge}))",
+            ),
+        ]
+
+        result = replicate_formulas(anchors, {0: grid}, direction="horizontal")
+
+        assert {r.formula for r in result} == {
+            f"sum_row(0, 1, 1, {huge})",
+            f"sum_row(0, 2, 1, {huge})",
+            f"sum_cells((0, 1, 1), (0, 1, {huge}))",
+            f"sum_cells((0, 2, 1), (0, 2, {huge}))",
+        }
+
     def test_missing_table_grid(self):
         """Should skip replication if table grid not found."""
         anchor = HorizontalVerticalCheckInferredFormula(
@@ -424,6 +523,26 @@ class TestEdgeCases:
         assert len(vertical_formulas) > 1
         assert len(horizontal_formulas) > 1
 
+    def test_boolean_column_not_numeric(self):
+        """Booleans are not amounts: a column of flags is not replicated to."""
+        grid = [
+            ["Item", "2024", "Audited"],
+            ["Revenue", 100, True],
+            ["Cost", 40, False],
+            ["Profit", 60, True],
+        ]
+        table_grids = {0: grid}
+
+        anchor = HorizontalVerticalCheckInferredFormula(
+            target_cell=TargetCell(table_index=0, row_index=3, col_index=1),
+            formula="sum_col(0, 1, 1, 2)",
+        )
+
+        result = replicate_formulas([anchor], table_grids, direction="vertical")
+
+        cols = [r.target_cell.col_index for r in result]
+        assert cols == [1]
+
     def test_partially_numeric_column(self):
         """Should replicate to columns with at least ONE numeric value in range."""
         grid = [
@@ -10,6 +10,11 @@ Tests cover:
 from typing import ClassVar
 from unittest.mock import MagicMock, patch
 
+from google.adk.sessions.state import State
+
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.schemas import (
+    ReconstructedFormula,
+)
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.callbacks import (
     after_in_table_parallel_callback,
 )
@@ -43,6 +48,20 @@ class TestAfterInTableParallelCallback:
 
         assert ctx.state.get("reconstructed_formulas") == []
 
+    def test_no_formulas_leaves_existing_entries_untouched(self):
+        """Without new formulas the existing list is not rewritten."""
+        existing = [{"check_type": "cross_table", "inferred_formulas": []}]
+        ctx = MagicMock()
+        ctx.state = {
+            "extracted_tables": {"tables": [{"table_index": 0, "grid": [["A"]]}]},
+            "reconstructed_formulas": existing,
+            "vertical_check_output": {"formulas": []},
+        }
+
+        after_in_table_parallel_callback(ctx)
+
+        assert ctx.state["reconstructed_formulas"] is existing
+
     def test_collect_vertical_formulas(self):
         """Should collect formulas from vertical check agent."""
         grid = [
@@ -348,6 +367,10 @@ class TestAfterInTableParallelCallback:
         assert isinstance(f["inferred_formulas"], list)
         assert "formula" in f["inferred_formulas"][0]
 
+        # Every entry matches the shared reconstructed_formulas contract
+        for entry in formulas:
+            assert ReconstructedFormula.model_validate(entry).model_dump() == entry
+
     def test_ignores_malformed_formulas(self):
         """Should skip formulas with missing required fields."""
         grid = [["Item", "Val"], ["A", 100]]
@@ -377,6 +400,39 @@ class TestAfterInTableParallelCallback:
         # Should only have the valid formula
         assert len(formulas) == 1
 
+    def test_existing_formulas_kept_and_recorded_as_delta(self):
+        """Appending to earlier entries must still produce a state delta."""
+        grid = [["Item", "Val"], ["A", 100]]
+        existing = {"check_type": "cross_table", "inferred_formulas": []}
+        delta: dict = {}
+
+        ctx = MagicMock()
+        ctx.state = State(
+            value={
+                "extracted_tables": {"tables": [{"table_index": 0, "grid": grid}]},
+                "reconstructed_formulas": [existing],
+                "vertical_check_output": {
+                    "formulas": [
+                        {
+                            "target_cell": {
+                                "table_index": 0,
+                                "row_index": 1,
+                                "col_index": 1,
+                            },
+                            "formula": "sum_col(0, 1, 0, 0)",
+                        }
+                    ]
+                },
+            },
+            delta=delta,
+        )
+
+        after_in_table_parallel_callback(ctx)
+
+        formulas = delta["reconstructed_formulas"]
+        assert formulas[0] is existing
+        assert len(formulas) == 2
+
 
 class TestDynamicReplication:
     """Test dynamic direction logic in logic_reconciliation_formula_inferer_output."""
@@ -574,6 +630,30 @@ class TestDedup:
         ]
         assert len(keys) == len(set(keys))
 
+    def test_duplicate_anchor_replicated_once(self):
+        """An anchor returned by several checks is only replicated once."""
+        formula = "sum_col(0, 1, 1, 2)"
+        target = {"table_index": 0, "row_index": 3, "col_index": 1}
+        entry = {"target_cell": target, "formula": formula}
+
+        ctx = MagicMock()
+        ctx.state = self._make_state(
+            vertical={"formulas": [entry, entry]},
+            logic={"formulas": [entry]},
+        )
+
+        module = "veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.callbacks"
+        with (
+            patch(f"{module}.detect_replication_direction", return_value="vertical"),
+            patch(
+                f"{module}.iter_replicated_formulas", return_value=iter([])
+            ) as mock_replicate,
+        ):
+            after_in_table_parallel_callback(ctx)
+
+        mock_replicate.assert_called_once()
+        assert len(mock_replicate.call_args.args[0]) == 1
+
     def test_different_formulas_same_cell_kept(self):
         """Two different formulas targeting the same cell should both survive."""
         target = {"table_index": 0, "row_index": 3, "col_index": 1}
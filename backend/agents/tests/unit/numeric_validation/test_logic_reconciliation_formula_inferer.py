@@ -7,6 +7,7 @@ import pytest
 from google.adk.agents import LlmAgent
 
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.sub_agents.logic_reconciliation_check.sub_agents.fan_out.agent import (
+    _MAX_TABLES_PER_CALL,
     _create_table_agent,
     _prepare_work_items,
     logic_reconciliation_formula_inferer,
@@ -38,7 +39,7 @@ class TestPrepareWorkItems:
     """Test the _prepare_work_items callback."""
 
     def test_filters_candidate_tables(self):
-        """Should return only tables matching candidate_table_indexes."""
+        """Should batch only tables matching candidate_table_indexes."""
         state = {
             "logic_reconciliation_check_screener_output": {
                 "candidate_table_indexes": [0, 2]
@@ -52,9 +53,12 @@ class TestPrepareWorkItems:
 
         result = _prepare_work_items(state)
 
-        assert len(result) == 2
-        assert result[0] == {"table_index": 0, "content": "T0"}
-        assert result[1] == {"table_index": 2, "content": "T2"}
+        assert result == [
+            [
+                {"table_index": 0, "content": "T0"},
+                {"table_index": 2, "content": "T2"},
+            ]
+        ]
 
     def test_returns_empty_when_no_candidates(self):
         """Should return [] when candidate_table_indexes is empty."""
@@ -95,8 +99,7 @@ class TestPrepareWorkItems:
 
         result = _prepare_work_items(state)
 
-        assert len(result) == 1
-        assert result[0] == {"table_index": 1, "content": "T1"}
+        assert result == [[{"table_index": 1, "content": "T1"}]]
 
     def test_handles_dict_with_tables_key(self):
         """Should handle extracted_tables as a dict with 'tables' key."""
@@ -114,8 +117,7 @@ class TestPrepareWorkItems:
 
         result = _prepare_work_items(state)
 
-        assert len(result) == 1
-        assert result[0] == {"table_index": 0, "content": "T0"}
+        assert result == [[{"table_index": 0, "content": "T0"}]]
 
     def test_handles_pydantic_screener_output(self):
         """Should call model_dump() on pydantic screener output."""
@@ -159,8 +161,43 @@ class TestPrepareWorkItems:
 
         result = _prepare_work_items(state)
 
-        assert len(result) == 1
-        assert result[0] == {"table_index": 0, "content": "T0"}
+        assert result == [[{"table_index": 0, "content": "T0"}]]
+
+    def test_repeated_table_index_keeps_first(self):
+        """Should resolve a repeated table_index to its first table."""
+        state = {
+            "logic_reconciliation_check_screener_output": {
+                "candidate_table_indexes": [0]
+            },
+            "extracted_tables": [
+                {"table_index": 0, "content": "first"},
+                {"table_index": 0, "content": "second"},
+            ],
+        }
+
+        result = _prepare_work_items(state)
+
+        assert result == [[{"table_index": 0, "content": "first"}]]
+
+    def test_caps_tables_per_batch(self):
+        """Should split candidates into batches of at most _MAX_TABLES_PER_CALL."""
+        n_tables = _MAX_TABLES_PER_CALL + 1
+        state = {
+            "logic_reconciliation_check_screener_output": {
+                "candidate_table_indexes": list(range(n_tables))
+            },
+            "extracted_tables": [
+                {"table_index": i, "grid": [[i]]} for i in range(n_tables)
+            ],
+        }
+
+        result = _prepare_work_items(state)
+
+        assert len(result) == 2
+        assert all(len(batch) <= _MAX_TABLES_PER_CALL for batch in result)
+        assert sorted(t["table_index"] for batch in result for t in batch) == list(
+            range(n_tables)
+        )
 
 
 # --- _create_table_agent Tests ---
@@ -171,41 +208,43 @@ class TestCreateTableAgent:
 
     def test_returns_llm_agent(self):
         """Should return an LlmAgent instance."""
-        table = {"table_index": 3, "content": "some data"}
-        agent = _create_table_agent(0, table, "test_output_key")
+        tables = [{"table_index": 3, "content": "some data"}]
+        agent = _create_table_agent(0, tables, "test_output_key")
 
         assert isinstance(agent, LlmAgent)
 
     def test_agent_name_includes_index(self):
         """Agent name should include the work-item index."""
-        table = {"table_index": 3, "content": "some data"}
-        agent = _create_table_agent(7, table, "test_output_key")
+        tables = [{"table_index": 3, "content": "some data"}]
+        agent = _create_table_agent(7, tables, "test_output_key")
 
         assert agent.name == "LogicReconciliationFormulaInfererTableAgent_7"
 
     def test_uses_provided_output_key(self):
         """Must use the output_key provided by FanOutAgent, not a custom one."""
-        table = {"table_index": 0, "content": "data"}
-        agent = _create_table_agent(0, table, "FanOut_item_0")
+        tables = [{"table_index": 0, "content": "data"}]
+        agent = _create_table_agent(0, tables, "FanOut_item_0")
 
         assert agent.output_key == "FanOut_item_0"
 
     def test_instruction_contains_table_data(self):
         """Instruction should contain the table data as JSON envelope."""
-        table = {"table_index": 2, "content": "test_content"}
-        agent = _create_table_agent(0, table, "key")
+        tables = [{"table_index": 2, "content": "test_content"}]
+        agent = _create_table_agent(0, tables, "key")
 
         # The instruction should contain the envelope JSON
         assert isinstance(agent.instruction, str)
         assert "test_content" in agent.instruction
         assert "tables" in agent.instruction
 
-    def test_wraps_table_in_envelope(self):
-        """Should wrap work_item in {'tables': [work_item]} envelope."""
-        table = {"table_index": 5, "content": "data"}
-        agent = _create_table_agent(0, table, "key")
+    def test_wraps_batch_in_envelope(self):
+        """Should wrap the work_item batch in a {'tables': work_item} envelope."""
+        tables = [{"table_index": 5, "content": "data"}]
+        agent = _create_table_agent(0, tables, "key")
 
-        expected_envelope = json.dumps({"tables": [table]})
+        expected_envelope = json.dumps(
+            {"tables": tables}, separators=(",", ":"), ensure_ascii=False
+        )
         assert isinstance(agent.instruction, str)
         assert expected_envelope in agent.instruction
 
@@ -285,12 +324,13 @@ class TestFanOutAgentWiring:
                 {"table_index": 1, "content": "T1"},
                 {"table_index": 2, "content": "T2"},
             ],
-            # Simulate sub-agent outputs (FanOutAgent uses "{name}_item_{i}" keys)
+            # Both candidates share one batch, so one sub-agent output
+            # (FanOutAgent uses "{name}_item_{i}" keys)
             "LogicReconciliationFormulaInferer_item_0": {
-                "formulas": [{"target_cell": {"table_index": 0}, "formulas": ["f1"]}]
-            },
-            "LogicReconciliationFormulaInferer_item_1": {
-                "formulas": [{"target_cell": {"table_index": 2}, "formulas": ["f2"]}]
+                "formulas": [
+                    {"target_cell": {"table_index": 0}, "formulas": ["f1"]},
+                    {"target_cell": {"table_index": 2}, "formulas": ["f2"]},
+                ]
             },
         }
 
@@ -7,10 +7,14 @@ No LLM calls are made.  The tests exercise:
     4. Edge cases             - empty tables, single table, index mismatches
 """
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
 
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.table_namer import (
+    prompt,
+)
 from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.table_namer.callbacks import (
     _parse_namer_output,
     after_agent_callback,
@@ -201,6 +205,23 @@ class TestAfterAgentCallbackHappy:
             ["Cash", 4520.0],
         ]
 
+    @pytest.mark.asyncio
+    async def test_writes_compact_json_copy(self):
+        """The prompt-facing JSON copy matches the envelope, without spacing."""
+        state = self._raw_state_two_tables()
+        state["table_namer_output"] = {
+            "table_names": [
+                {"table_index": 0, "table_name": "A"},
+                {"table_index": 1, "table_name": "B"},
+            ]
+        }
+
+        await after_agent_callback(_mock_ctx(state))
+
+        tables_json = state["extracted_tables_json"]
+        assert json.loads(tables_json) == state["extracted_tables"]
+        assert ", " not in tables_json
+
 
 # ===========================================================================
 # 3. Fallback path — unparsable LLM output
@@ -435,3 +456,19 @@ class TestParseNamerOutput:
     def test_fenced_json_string(self):
         fenced = '```json\n[{"table_index": 3, "table_name": "Fenced"}]\n```'
         assert _parse_namer_output(fenced) == {3: "Fenced"}
+
+
+# ---------------------------------------------------------------------------
+# Prompt split
+# ---------------------------------------------------------------------------
+
+
+class TestPromptSplit:
+    def test_static_instruction_has_no_state_placeholders(self):
+        assert "{document_markdown}" not in prompt.STATIC_INSTRUCTION
+        assert "{extracted_tables_raw}" not in prompt.STATIC_INSTRUCTION
+
+    def test_instruction_carries_per_document_inputs(self):
+        assert "{document_markdown}" in prompt.INSTRUCTION
+        assert "{extracted_tables_raw}" in prompt.INSTRUCTION
+        assert "### Role" not in prompt.INSTRUCTION
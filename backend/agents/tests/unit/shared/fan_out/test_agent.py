@@ -1,6 +1,6 @@
 """Unit tests for the generic FanOutAgent."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from google.adk.agents import LlmAgent
@@ -418,3 +418,122 @@ async def test_full_flow():
             {"id": 2, "reviewed": True},
         ]
     }
+
+
+# --- Partial Result Streaming Tests ---
+
+
+@pytest.mark.asyncio
+async def test_partial_results_not_streamed_by_default():
+    factory, _ = _make_agent_factory()
+    config = _create_config(
+        prepare_work_items=lambda state: ["a"], create_agent=factory
+    )
+    agent = FanOutAgent(name="TestFanOut", config=config)
+
+    ctx = MagicMock()
+    ctx.session.state = {"TestFanOut_item_0": {"findings": [{"id": 1}]}}
+
+    async for _ in agent._run_async_impl(ctx):
+        pass
+
+    assert "test_output_partial" not in ctx.session.state
+
+
+@pytest.mark.asyncio
+async def test_partial_results_streamed_per_item():
+    factory, _ = _make_agent_factory()
+    config = _create_config(
+        prepare_work_items=lambda state: ["a", "b", "c"],
+        create_agent=factory,
+        stream_partial_results=True,
+    )
+    agent = FanOutAgent(name="TestFanOut", config=config)
+
+    ctx = MagicMock()
+    ctx.session.state = {
+        "TestFanOut_item_0": {"findings": [{"id": 1}]},
+        # item_1 missing — no partial event for it
+        "TestFanOut_item_2": {"findings": [{"id": 3}]},
+    }
+
+    partial_deltas = [
+        event.actions.state_delta["test_output_partial"]
+        async for event in agent._run_async_impl(ctx)
+        if "test_output_partial" in event.actions.state_delta
+    ]
+
+    assert len(partial_deltas) == 2
+    assert len(partial_deltas[-1]["findings"]) == 2
+    assert ctx.session.state["test_output"] == {"findings": [{"id": 1}, {"id": 3}]}
+
+
+# --- Single Item Fast Path Tests ---
+
+
+@pytest.mark.asyncio
+async def test_single_item_runs_without_tasks():
+    """A single work item runs inline instead of through asyncio tasks."""
+    factory, calls = _make_agent_factory()
+    config = _create_config(
+        prepare_work_items=lambda state: ["a"], create_agent=factory
+    )
+    agent = FanOutAgent(name="TestFanOut", config=config)
+
+    ctx = MagicMock()
+    ctx.session.state = {"TestFanOut_item_0": {"findings": [{"id": 1}]}}
+
+    with patch("veritas_ai_agent.shared.fan_out.agent.asyncio.create_task") as ct:
+        async for _ in agent._run_async_impl(ctx):
+            pass
+
+    ct.assert_not_called()
+    assert len(calls) == 1
+    assert ctx.session.state["test_output"] == {"findings": [{"id": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_default_aggregation_reuses_item_dicts():
+    """Merged results are the items' own dicts, not re-validated copies."""
+    factory, _ = _make_agent_factory()
+    config = _create_config(
+        prepare_work_items=lambda state: ["a", "b"], create_agent=factory
+    )
+    agent = FanOutAgent(name="TestFanOut", config=config)
+
+    first, second = {"id": 1}, {"id": 2}
+    ctx = MagicMock()
+    ctx.session.state = {
+        "TestFanOut_item_0": {"findings": [first]},
+        "TestFanOut_item_1": {"findings": [second]},
+    }
+
+    async for _ in agent._run_async_impl(ctx):
+        pass
+
+    merged = ctx.session.state["test_output"]["findings"]
+    assert merged[0] is first
+    assert merged[1] is second
+
+
+@pytest.mark.asyncio
+async def test_collection_ignores_stale_item_keys():
+    """Only the item keys created by this run are collected."""
+    factory, _ = _make_agent_factory()
+    config = _create_config(
+        prepare_work_items=lambda state: ["a"],
+        create_agent=factory,
+    )
+    agent = FanOutAgent(name="TestFanOut", config=config)
+
+    ctx = MagicMock()
+    ctx.session.state = {
+        "TestFanOut_item_0": {"findings": [{"id": 1}]},
+        # Left over from an earlier run with more work items
+        "TestFanOut_item_1": {"findings": [{"id": "stale"}]},
+    }
+
+    async for _ in agent._run_async_impl(ctx):
+        pass
+
+    assert ctx.session.state["test_output"] == {"findings": [{"id": 1}]}
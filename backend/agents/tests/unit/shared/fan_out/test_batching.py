@@ -0,0 +1,24 @@
+"""Unit tests for the fan-out batching helper."""
+
+from itertools import chain
+
+import pytest
+
+from veritas_ai_agent.shared.fan_out import chunked
+
+
+def test_chunks_with_short_tail():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_empty_input_yields_nothing():
+    assert list(chunked([], 5)) == []
+
+
+def test_batches_span_chained_sources():
+    assert list(chunked(chain([1, 2], [], [3]), 2)) == [[1, 2], [3]]
+
+
+def test_non_positive_size_rejected():
+    with pytest.raises(ValueError):
+        list(chunked([1], 0))
@@ -167,6 +167,39 @@ async def test_run_async_flow():
         mock_sequential_run.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_single_chain_runs_without_parallel_agent():
+    """A single chain runs directly, on the branch ParallelAgent would give it."""
+    config = _create_mock_config(n_parallel_chains=1)
+
+    with (
+        patch(
+            "google.adk.agents.ParallelAgent.run_async", return_value=AsyncIterator([])
+        ) as mock_parallel_run,
+        patch("google.adk.agents.LlmAgent.run_async", return_value=AsyncIterator([])),
+        patch(
+            "google.adk.agents.SequentialAgent.run_async",
+            return_value=AsyncIterator([]),
+        ) as mock_sequential_run,
+    ):
+        agent = MultiPassRefinementAgent(name="TestAgent", config=config)
+
+        ctx = MagicMock()
+        ctx.session.state = {}
+        ctx.branch = "Root.TestAgent"
+
+        async for _e in agent._run_async_impl(ctx):
+            pass
+
+        mock_parallel_run.assert_not_called()
+        mock_sequential_run.assert_called_once()
+        chain_ctx = mock_sequential_run.call_args.args[0]
+        assert (
+            chain_ctx.branch
+            == "Root.TestAgent.TestAgent_ParallelChains.TestAgent_Chain_0"
+        )
+
+
 @pytest.mark.asyncio
 async def test_findings_collection_logic():
     """Verify that findings are correctly collected from state before aggregation."""
@@ -222,6 +255,30 @@ async def test_findings_collection_logic():
         assert str(expected_json_len) in prompt
 
 
+@pytest.mark.asyncio
+async def test_transform_findings_applied_before_aggregation():
+    """transform_findings rewrites the collected findings the aggregator sees."""
+    config = _create_mock_config(transform_findings=lambda findings: findings[:1])
+
+    with (
+        patch(
+            "google.adk.agents.ParallelAgent.run_async", return_value=AsyncIterator([])
+        ),
+        patch("google.adk.agents.LlmAgent.run_async", return_value=AsyncIterator([])),
+    ):
+        agent = MultiPassRefinementAgent(name="TestAgent", config=config)
+        ctx = MagicMock()
+        ctx.session.state = {
+            "TestAgent_chain_0_accumulated_findings": [{"issue": "error1"}],
+            "TestAgent_chain_1_accumulated_findings": [{"issue": "error2"}],
+        }
+
+        async for _ in agent._run_async_impl(ctx):
+            pass
+
+    assert ctx.session.state[agent._internal_findings_key] == [{"issue": "error1"}]
+
+
 def test_model_config_resolution():
     """Test that models are correctly specified in agent configs."""
     config = _create_mock_config()
@@ -295,3 +352,22 @@ def test_chain_unrolling_structure():
     pass2 = chain_sequence.sub_agents[2]
     assert pass2.name == "TestAgent_Chain0_Pass2"
     assert pass2.output_key == "TestAgent_chain_0_pass_2_output"
+
+
+def test_static_instruction_passed_to_agents():
+    """Static instructions reach the chain and aggregator LlmAgents."""
+    chain_config = MultiPassRefinementLlmAgentConfig(
+        output_schema=MockPassOutput,
+        get_instruction=_mock_get_pass_instruction,
+        static_instruction="Chain system prompt",
+    )
+    config = _create_mock_config(chain_agent_config=chain_config)
+
+    agent = MultiPassRefinementAgent(name="TestAgent", config=config)
+
+    assert agent.parallel_agent is not None
+    for chain_sequence in agent.parallel_agent.sub_agents:
+        for pass_agent in chain_sequence.sub_agents:
+            assert pass_agent.static_instruction == "Chain system prompt"
+    assert agent.aggregator_agent is not None
+    assert agent.aggregator_agent.static_instruction is None
@@ -0,0 +1,124 @@
+"""Unit tests for the shared HedgedGemini model wrapper."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from veritas_ai_agent.shared import hedged_llm
+from veritas_ai_agent.shared.hedged_llm import HedgedGemini
+
+
+def _make_response(text: str) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+def _make_model() -> HedgedGemini:
+    return HedgedGemini(
+        model="gemini-hedge-test",
+        hedge_initial_delay=0.05,
+        hedge_min_delay=0.05,
+        hedge_jitter=0.0,
+    )
+
+
+def _fake_generate(delays: list[float], errors: set[int] | None = None):
+    """Return a fake Gemini.generate_content_async with per-call delays."""
+    calls: list[int] = []
+
+    async def fake(self, llm_request, stream=False):
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[index])
+        if errors and index in errors:
+            raise RuntimeError(f"call {index} failed")
+        yield _make_response(f"call {index}")
+
+    return fake, calls
+
+
+async def _run(model: HedgedGemini) -> list[LlmResponse]:
+    return [r async for r in model.generate_content_async(LlmRequest())]
+
+
+@pytest.fixture(autouse=True)
+def _reset_latency():
+    hedged_llm._latency_ewma.clear()
+    yield
+    hedged_llm._latency_ewma.clear()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    fake, calls = _fake_generate([0.0, 0.0])
+    with patch.object(Gemini, "generate_content_async", fake):
+        responses = await _run(_make_model())
+
+    assert len(calls) == 1
+    assert responses[0].content.parts[0].text == "call 0"
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_loses_to_hedge():
+    fake, calls = _fake_generate([1.0, 0.0])
+    with patch.object(Gemini, "generate_content_async", fake):
+        responses = await _run(_make_model())
+
+    assert len(calls) == 2
+    assert responses[0].content.parts[0].text == "call 1"
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_records_latency_from_primary_start():
+    model = _make_model()
+    fake, _ = _fake_generate([1.0, 0.0])
+    with patch.object(Gemini, "generate_content_async", fake):
+        await _run(model)
+
+    # The hedge itself answers instantly; the recorded latency must still
+    # cover the hedge delay the caller waited through
+    assert hedged_llm._latency_ewma[model.model] >= model.hedge_min_delay
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_does_not_copy_request():
+    fake, _ = _fake_generate([0.0])
+    with (
+        patch.object(Gemini, "generate_content_async", fake),
+        patch.object(LlmRequest, "model_copy") as model_copy,
+    ):
+        await _run(_make_model())
+
+    model_copy.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_falls_back_to_primary():
+    fake, calls = _fake_generate([0.2, 0.0], errors={1})
+    with patch.object(Gemini, "generate_content_async", fake):
+        responses = await _run(_make_model())
+
+    assert len(calls) == 2
+    assert responses[0].content.parts[0].text == "call 0"
+
+
+@pytest.mark.asyncio
+async def test_primary_error_is_raised_without_hedge():
+    fake, calls = _fake_generate([0.0], errors={0})
+    with patch.object(Gemini, "generate_content_async", fake):
+        with pytest.raises(RuntimeError, match="call 0 failed"):
+            await _run(_make_model())
+
+    assert len(calls) == 1
+
+
+def test_hedge_delay_tracks_latency_average():
+    model = _make_model()
+    hedged_llm._record_latency(model.model, 10.0)
+    assert model.hedge_delay() == pytest.approx(15.0)
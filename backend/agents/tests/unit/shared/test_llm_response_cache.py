@@ -0,0 +1,130 @@
+"""Unit tests for the shared LlmResponseCache."""
+
+from unittest.mock import MagicMock
+
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from veritas_ai_agent.shared.llm_response_cache import LlmResponseCache
+
+
+def _make_request(instruction: str = "Review these findings") -> LlmRequest:
+    return LlmRequest(
+        model="gemini-test",
+        contents=[types.Content(role="user", parts=[types.Part(text="input")])],
+        config=types.GenerateContentConfig(system_instruction=instruction),
+    )
+
+
+def _make_response(text: str = '{"findings": []}') -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+def _make_context(agent_name: str = "Agent") -> MagicMock:
+    ctx = MagicMock()
+    ctx.invocation_id = "inv-1"
+    ctx.agent_name = agent_name
+    return ctx
+
+
+# ---------------------------------------------------------------------------
+# Key construction
+# ---------------------------------------------------------------------------
+
+
+def test_key_is_stable_for_identical_requests():
+    assert LlmResponseCache.make_key(_make_request()) == LlmResponseCache.make_key(
+        _make_request()
+    )
+
+
+def test_key_changes_with_instruction():
+    assert LlmResponseCache.make_key(_make_request("a")) != LlmResponseCache.make_key(
+        _make_request("b")
+    )
+
+
+def test_key_changes_with_generation_config():
+    base = _make_request()
+    tweaked = _make_request()
+    assert tweaked.config is not None
+    tweaked.config.temperature = 0.7
+    tweaked.config.thinking_config = types.ThinkingConfig(thinking_level="high")
+    assert LlmResponseCache.make_key(base) != LlmResponseCache.make_key(tweaked)
+
+
+def test_key_ignores_http_options():
+    request = _make_request()
+    assert request.config is not None
+    request.config.http_options = types.HttpOptions(headers={"x-test": "1"})
+    assert LlmResponseCache.make_key(request) == LlmResponseCache.make_key(
+        _make_request()
+    )
+
+
+# ---------------------------------------------------------------------------
+# Callbacks
+# ---------------------------------------------------------------------------
+
+
+def test_disabled_cache_is_noop():
+    cache = LlmResponseCache(None)
+    ctx = _make_context()
+    assert not cache.enabled
+    assert cache.before_model_callback(ctx, _make_request()) is None
+    assert cache.after_model_callback(ctx, _make_response()) is None
+    assert cache._pending == {}
+
+
+def test_miss_then_hit_returns_stored_response(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"))
+    ctx = _make_context()
+
+    assert cache.before_model_callback(ctx, _make_request()) is None
+    cache.after_model_callback(ctx, _make_response("cached"))
+
+    hit = cache.before_model_callback(ctx, _make_request())
+    assert hit is not None
+    assert hit.content is not None
+    assert hit.content.parts is not None
+    assert hit.content.parts[0].text == "cached"
+
+
+def test_error_response_is_not_stored(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"))
+    ctx = _make_context()
+
+    cache.before_model_callback(ctx, _make_request())
+    cache.after_model_callback(
+        ctx, LlmResponse(error_code="UNAVAILABLE", error_message="boom")
+    )
+
+    assert cache.before_model_callback(ctx, _make_request()) is None
+
+
+def test_partial_response_is_not_stored(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"))
+    ctx = _make_context()
+
+    cache.before_model_callback(ctx, _make_request())
+    partial = _make_response()
+    partial.partial = True
+    cache.after_model_callback(ctx, partial)
+
+    assert cache.before_model_callback(ctx, _make_request()) is None
+
+
+def test_failed_call_clears_pending_key(tmp_path):
+    cache = LlmResponseCache(str(tmp_path / "cache.sqlite"))
+    ctx = _make_context()
+
+    cache.before_model_callback(ctx, _make_request())
+    assert cache._pending
+
+    result = cache.on_model_error_callback(ctx, _make_request(), RuntimeError("x"))
+
+    assert result is None
+    assert cache._pending == {}
@@ -0,0 +1,22 @@
+"""Unit tests for shared model helpers."""
+
+from pydantic import BaseModel
+
+from veritas_ai_agent.shared.model_utils import as_dict
+
+
+class _Output(BaseModel):
+    findings: list[dict] = []
+
+
+def test_model_is_dumped():
+    assert as_dict(_Output(findings=[{"id": 1}])) == {"findings": [{"id": 1}]}
+
+
+def test_dict_passes_through_unchanged():
+    output = {"findings": [{"id": 1}]}
+    assert as_dict(output) is output
+
+
+def test_none_passes_through():
+    assert as_dict(None) is None
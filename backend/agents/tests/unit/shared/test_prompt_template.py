@@ -0,0 +1,38 @@
+"""Unit tests for precompiled instruction templates."""
+
+import pytest
+
+from veritas_ai_agent.shared.prompt_template import PromptTemplate
+
+
+def test_state_values_substituted():
+    template = PromptTemplate("Tables: {tables}\nFindings: {findings}")
+    assert template.render({"tables": "T", "findings": [1]}) == (
+        "Tables: T\nFindings: [1]"
+    )
+
+
+def test_keys_in_order():
+    assert PromptTemplate("{b} {a} {b}").keys == ("b", "a", "b")
+
+
+def test_json_braces_left_intact():
+    text = 'Example: {"table_index": 0} and {not a key}'
+    assert PromptTemplate(text).render({}) == text
+
+
+def test_prefixed_state_key():
+    assert PromptTemplate("{temp:x}").render({"temp:x": "y"}) == "y"
+
+
+def test_none_renders_empty():
+    assert PromptTemplate("a{x}b").render({"x": None}) == "ab"
+
+
+def test_optional_missing_renders_empty():
+    assert PromptTemplate("a{x?}b").render({}) == "ab"
+
+
+def test_missing_key_raises():
+    with pytest.raises(KeyError, match="x"):
+        PromptTemplate("{x}").render({})
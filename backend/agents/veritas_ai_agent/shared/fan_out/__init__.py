@@ -6,12 +6,16 @@ FanOutAgent : BaseAgent
     Main agent that orchestrates fan-out parallel execution
 FanOutConfig : dataclass
     Configuration including work-item preparation, agent factory, and aggregation
+chunked : function
+    Splits an iterable into fixed-size batches of work items
 """
 
 from .agent import FanOutAgent
+from .batching import chunked
 from .config import FanOutConfig
 
 __all__ = [
     "FanOutAgent",
     "FanOutConfig",
+    "chunked",
 ]
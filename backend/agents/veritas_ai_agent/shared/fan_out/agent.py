@@ -5,7 +5,7 @@ runs them concurrently (throttled by a global semaphore), and aggregates
 results back into state.
 
 Concurrency is controlled by a process-wide ``asyncio.Semaphore`` whose limit
-is set via the ``FANOUT_MAX_CONCURRENCY`` environment variable (default: 10).
+is set via the ``FANOUT_MAX_CONCURRENCY`` environment variable (default: 8).
 This prevents exceeding Gemini API rate limits regardless of how many
 FanOutAgent instances are active.
 """
@@ -20,6 +20,8 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event, EventActions
 from google.genai import types
 
+from veritas_ai_agent.shared.model_utils import as_dict
+
 from .config import FanOutConfig
 
 logger = logging.getLogger(__name__)
@@ -104,30 +106,25 @@ class FanOutAgent(BaseAgent):
             agents.append(agent)
             output_keys.append(key)
 
-        # 4. Run all agents concurrently, throttled by global semaphore
-        semaphore = _get_semaphore()
-
-        async def _run_agent(agent: BaseAgent) -> list[Event]:
-            async with semaphore:
-                events = []
-                async for event in agent.run_async(ctx):
-                    events.append(event)
-                return events
-
-        tasks = [asyncio.create_task(_run_agent(agent)) for agent in agents]
-        for completed in asyncio.as_completed(tasks):
-            for event in await completed:
+        # 4. Run all agents concurrently, throttled by global semaphore.
+        # A single item needs no task scheduling or event buffering, and its
+        # output is already the final result (no partials to stream).
+        if len(agents) == 1:
+            async with _get_semaphore():
+                async for event in agents[0].run_async(ctx):
+                    yield event
+        else:
+            async for event in self._run_concurrently(ctx, agents, output_keys):
                 yield event
 
-        # 5. Collect & normalize outputs
+        # 5. Collect & normalize outputs. Only the keys created above are
+        # read, so stale item keys left in state by an earlier, larger run
+        # are never picked up and the rest of the state is never scanned.
         outputs = []
         for key in output_keys:
-            output = state.get(key)
-            if output is None:
-                continue
-            if hasattr(output, "model_dump"):
-                output = output.model_dump()
-            outputs.append(output)
+            output = as_dict(state.get(key))
+            if output is not None:
+                outputs.append(output)
 
         # 6. Aggregate
         if self.config.aggregate:
@@ -170,3 +167,43 @@ class FanOutAgent(BaseAgent):
             self.config.results_field,
             _MAX_CONCURRENCY,
         )
+
+    async def _run_concurrently(
+        self,
+        ctx: InvocationContext,
+        agents: list[BaseAgent],
+        output_keys: list[str],
+    ) -> AsyncGenerator[Event, None]:
+        """Run agents as concurrent tasks, yielding their events as each finishes."""
+        assert self.config is not None
+        state = ctx.session.state
+        semaphore = _get_semaphore()
+
+        async def _run_agent(index: int, agent: BaseAgent) -> tuple[int, list[Event]]:
+            async with semaphore:
+                events = []
+                async for event in agent.run_async(ctx):
+                    events.append(event)
+                return index, events
+
+        partial_key = f"{self.config.output_key}_partial"
+        partial_items: list = []
+        tasks = [
+            asyncio.create_task(_run_agent(i, agent)) for i, agent in enumerate(agents)
+        ]
+        for completed in asyncio.as_completed(tasks):
+            index, events = await completed
+            for event in events:
+                yield event
+
+            # Publish results as each item finishes instead of only at the end
+            if self.config.stream_partial_results:
+                output = as_dict(state.get(output_keys[index]))
+                if output is not None:
+                    partial_items.extend(output.get(self.config.results_field, []))
+                    partial = {self.config.results_field: list(partial_items)}
+                    state[partial_key] = partial
+                    yield Event(
+                        author=self.name,
+                        actions=EventActions(state_delta={partial_key: partial}),
+                    )
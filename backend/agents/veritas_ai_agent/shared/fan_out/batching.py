@@ -0,0 +1,27 @@
+"""Helpers for splitting work into fan-out batches."""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive lists of at most ``size`` items.
+
+    Works on any iterable, so callers can pass ``itertools.chain(...)`` over
+    several sources without first concatenating them into one list.
+
+    Parameters
+    ----------
+    items : Iterable[T]
+        Items to batch.
+    size : int
+        Maximum batch size (must be positive).
+    """
+    if size < 1:
+        raise ValueError(f"Batch size must be positive, got {size}")
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
@@ -27,6 +27,17 @@ class FanOutConfig:
         ``.model_dump()``'d). Returns value to write to
         ``state[output_key]``. Default: concatenates all
         ``output[results_field]`` lists into ``{results_field: all_items}``.
+        ADK validates each item against its ``output_schema`` before
+        writing it to state, so aggregators should merge the dicts as-is
+        rather than re-validating them through the schema.
+
+    Streaming
+    ---------
+    With ``stream_partial_results`` set, every completed item also emits an
+    event writing ``{results_field: items_so_far}`` to
+    ``state[f"{output_key}_partial"]``, so consumers can start on results at
+    the fastest item's latency rather than the slowest's.  The final
+    ``output_key`` is still written once all items finish.
     """
 
     # === Required Fields ===
@@ -38,3 +49,4 @@ class FanOutConfig:
     aggregate: Callable[[list[dict]], Any] | None = None
     results_field: str = "findings"
     empty_message: str | None = None
+    stream_partial_results: bool = False
@@ -0,0 +1,121 @@
+"""Gemini model wrapper that hedges slow requests.
+
+Pro models with high thinking have a long latency tail: most calls finish
+close to the typical latency, a few take several times longer and stall the
+whole pipeline.  ``HedgedGemini`` sends the request once and, if no response
+has arrived after a delay derived from the recent latency of the same model,
+sends an identical second request.  The first successful response wins and the
+other request is cancelled.
+
+The hedge delay is ``hedge_delay_factor`` times an exponentially weighted
+moving average of past latencies (``hedge_initial_delay`` until the first
+call completes), never below ``hedge_min_delay``, plus a random jitter so that
+parallel callers do not hedge in lockstep.
+
+Usage::
+
+    from veritas_ai_agent.shared.hedged_llm import HedgedGemini
+
+    LlmAgent(model=HedgedGemini(model=GEMINI_PRO), ...)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncGenerator
+
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+# EWMA of successful call latency in seconds, keyed by model name; a hedged
+# call counts from its primary's start until the winning response
+_latency_ewma: dict[str, float] = {}
+_EWMA_ALPHA = 0.2
+
+
+def _record_latency(model: str, seconds: float) -> None:
+    previous = _latency_ewma.get(model)
+    _latency_ewma[model] = (
+        seconds
+        if previous is None
+        else _EWMA_ALPHA * seconds + (1 - _EWMA_ALPHA) * previous
+    )
+
+
+class HedgedGemini(Gemini):
+    """Gemini model that races a second request when the first one is slow.
+
+    Only non-streaming calls are hedged; streaming calls pass through.
+    """
+
+    hedge_initial_delay: float = 120.0
+    hedge_min_delay: float = 15.0
+    hedge_delay_factor: float = 1.5
+    hedge_jitter: float = 0.2
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary request before hedging."""
+        ewma = _latency_ewma.get(self.model)
+        base = self.hedge_initial_delay if ewma is None else ewma
+        delay = max(self.hedge_min_delay, base * self.hedge_delay_factor)
+        return delay * (1 + random.uniform(0, self.hedge_jitter))
+
+    async def _collect(self, llm_request: LlmRequest) -> list[LlmResponse]:
+        responses = []
+        async for response in super().generate_content_async(llm_request):
+            responses.append(response)
+        return responses
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if stream:
+            async for response in super().generate_content_async(
+                llm_request, stream=True
+            ):
+                yield response
+            return
+
+        start = time.monotonic()
+        tasks = {asyncio.create_task(self._collect(llm_request))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done:
+                logger.info("%s: primary request slow, sending hedge", self.model)
+                # Gemini mutates the request while sending it, so the hedge
+                # gets its own copy.  The edits it makes are idempotent, which
+                # lets the copy wait until a hedge is actually sent.
+                hedge_request = llm_request.model_copy(deep=True)
+                tasks.add(asyncio.create_task(self._collect(hedge_request)))
+            responses = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Measured from the primary's start, so a hedged call records the
+        # latency the caller saw rather than the hedge's own shorter run
+        _record_latency(self.model, time.monotonic() - start)
+
+        for response in responses:
+            yield response
+
+
+async def _first_success(tasks: set[asyncio.Task]) -> list[LlmResponse]:
+    """Return the result of the first task that succeeds.
+
+    Raises the last error if every task fails.
+    """
+    pending = set(tasks)
+    error: BaseException | None = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task.result()
+            error = task.exception()
+    assert error is not None
+    raise error
@@ -0,0 +1,155 @@
+"""Content-addressed cache for LLM responses, keyed by the full model request.
+
+Re-running the pipeline on the same document (development loops, regression
+runs, retries after a downstream failure) otherwise pays for every Gemini call
+again.  The cache is disabled unless ``LLM_RESPONSE_CACHE_PATH`` points at a
+SQLite file, so production runs always hit the model.
+
+The key is a BLAKE2b digest of the model name, the generation config (system
+instruction, sampling and thinking settings, tools), the request contents and
+the response schema name.  Anything that changes the prompt or how the model
+answers it therefore produces a miss.
+
+Usage::
+
+    from veritas_ai_agent.shared.llm_response_cache import llm_response_cache
+
+    LlmAgent(
+        ...,
+        before_model_callback=llm_response_cache.before_model_callback,
+        after_model_callback=llm_response_cache.after_model_callback,
+        on_model_error_callback=[
+            llm_response_cache.on_model_error_callback,
+            default_model_error_handler,
+        ],
+    )
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+
+class LlmResponseCache:
+    """SQLite-backed LLM response cache exposed as ADK model callbacks.
+
+    ``before_model_callback`` returns the stored response on a hit, which makes
+    ADK skip the model call.  On a miss the request key is remembered per
+    invocation and agent so ``after_model_callback`` can store the final
+    response; ``on_model_error_callback`` forgets it when the call fails.
+    With ``path=None`` all callbacks are no-ops.
+    """
+
+    def __init__(self, path: str | None, *, name: str = "LlmResponseCache"):
+        self.path = path
+        self.name = name
+        self._conn: sqlite3.Connection | None = None
+        self._pending: dict[tuple[str, str], str] = {}
+
+    @classmethod
+    def from_env(cls) -> "LlmResponseCache":
+        """Build a cache from ``LLM_RESPONSE_CACHE_PATH`` (disabled if unset)."""
+        return cls(os.environ.get("LLM_RESPONSE_CACHE_PATH") or None)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            assert self.path is not None
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(llm_request: LlmRequest) -> str:
+        """Hash everything in the request that influences the response."""
+        digest = hashlib.blake2b(digest_size=32)
+        config = llm_request.config
+        schema = config.response_schema if config else None
+        digest.update((llm_request.model or "").encode())
+        digest.update(b"\x00")
+        if config:
+            # The schema class is hashed by name below; HTTP options only
+            # affect transport and labels only billing
+            digest.update(
+                config.model_dump_json(
+                    exclude={"response_schema", "http_options", "labels"},
+                    exclude_none=True,
+                ).encode()
+            )
+        digest.update(b"\x00")
+        for content in llm_request.contents:
+            digest.update(content.model_dump_json(exclude_none=True).encode())
+        digest.update(b"\x00")
+        digest.update(getattr(schema, "__name__", str(schema)).encode())
+        return digest.hexdigest()
+
+    def before_model_callback(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> LlmResponse | None:
+        """Return the cached response for this request, if any."""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(llm_request)
+        row = (
+            self._get_conn()
+            .execute("SELECT response FROM llm_responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is not None:
+            logger.info("%s: hit for %s", self.name, callback_context.agent_name)
+            return LlmResponse.model_validate_json(row[0])
+
+        self._pending[(callback_context.invocation_id, callback_context.agent_name)] = (
+            key
+        )
+        return None
+
+    def after_model_callback(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> LlmResponse | None:
+        """Store a complete, successful response under its request key."""
+        if not self.enabled or llm_response.partial:
+            return None
+
+        key = self._pending.pop(
+            (callback_context.invocation_id, callback_context.agent_name), None
+        )
+        if key is None or llm_response.error_code or not llm_response.content:
+            return None
+
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_responses (key, response) VALUES (?, ?)",
+            (key, llm_response.model_dump_json(exclude_none=True)),
+        )
+        conn.commit()
+        return None
+
+    def on_model_error_callback(
+        self,
+        callback_context: CallbackContext,
+        llm_request: LlmRequest,
+        error: Exception,
+    ) -> LlmResponse | None:
+        """Forget the pending key of a failed call; leaves handling to the next callback."""
+        self._pending.pop(
+            (callback_context.invocation_id, callback_context.agent_name), None
+        )
+        return None
+
+
+llm_response_cache = LlmResponseCache.from_env()
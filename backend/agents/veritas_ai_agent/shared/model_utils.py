@@ -0,0 +1,16 @@
+"""Helpers for values that may arrive as pydantic models or plain dicts."""
+
+from typing import Any
+
+
+def as_dict(value: Any) -> Any:
+    """Return ``value.model_dump()`` for pydantic models, anything else as-is.
+
+    ADK validates ``output_schema`` results and stores them in state as plain
+    dicts, so dicts are checked first and returned without an attribute
+    probe.  The dump is deliberately not cached on the model: models are
+    mutable, and an extra attribute would change their equality.
+    """
+    if isinstance(value, dict) or not hasattr(value, "model_dump"):
+        return value
+    return value.model_dump()
@@ -13,6 +13,7 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
 
 from veritas_ai_agent.shared.error_handler import default_model_error_handler
+from veritas_ai_agent.shared.model_utils import as_dict
 
 from .config import MultiPassRefinementConfig
 
@@ -89,7 +90,7 @@ class MultiPassRefinementAgent(BaseAgent):
         assert self.aggregator_agent is not None
 
         # --- Phase 1: Run N parallel chains ---
-        async for event in self.parallel_agent.run_async(ctx):
+        async for event in self._run_chains(ctx):
             yield event
 
         # --- Phase 2: Collect all findings from all chains ---
@@ -99,13 +100,17 @@ class MultiPassRefinementAgent(BaseAgent):
             key = f"{self.name}_chain_{chain_idx}_accumulated_findings"
             chain_findings = state.get(key, [])
             all_findings.extend(chain_findings)
+        n_collected = len(all_findings)
+        if self.config.transform_findings:
+            all_findings = self.config.transform_findings(all_findings)
 
         # Store findings in state so the Aggregator's dynamic instruction can read them
         state[self._internal_findings_key] = all_findings
 
         logger.info(
-            "%s: collected %d total findings from %d chains x %d passes",
+            "%s: collected %d total findings (%d after transform) from %d chains x %d passes",
             self.name,
+            n_collected,
             len(all_findings),
             self.config.n_parallel_chains,
             self.config.m_sequential_passes,
@@ -115,6 +120,25 @@ class MultiPassRefinementAgent(BaseAgent):
         async for event in self.aggregator_agent.run_async(ctx):
             yield event
 
+    def _run_chains(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """Run the chains, bypassing ParallelAgent when there is only one.
+
+        A single chain gains nothing from ParallelAgent's task and queue
+        plumbing, so it runs directly.  It gets the same branch ParallelAgent
+        would assign, keeping its events hidden from the aggregator's history.
+        """
+        assert self.parallel_agent is not None
+        chains = self.parallel_agent.sub_agents
+        if len(chains) != 1:
+            return self.parallel_agent.run_async(ctx)
+
+        chain_ctx = ctx.model_copy()
+        branch_suffix = f"{self.parallel_agent.name}.{chains[0].name}"
+        chain_ctx.branch = (
+            f"{ctx.branch}.{branch_suffix}" if ctx.branch else branch_suffix
+        )
+        return chains[0].run_async(chain_ctx)
+
     def _create_chain_sequence(
         self, agent_name: str, config: MultiPassRefinementConfig, chain_idx: int
     ) -> SequentialAgent:
@@ -145,9 +169,7 @@ class MultiPassRefinementAgent(BaseAgent):
                     output = callback_context.state.get(current_pass_key)
                     if not output:
                         return
-                    if hasattr(output, "model_dump"):
-                        output = output.model_dump()
-                    new_findings = config.extract_findings(output)
+                    new_findings = config.extract_findings(as_dict(output))
                     # Explicitly set the key back to trigger state update events by creating a new list
                     # (In-place modification might not trigger the state change listener)
                     current_findings = list(callback_context.state[accumulated_key])
@@ -167,6 +189,7 @@ class MultiPassRefinementAgent(BaseAgent):
             agent_kwargs = {
                 "name": f"{agent_name}_Chain{chain_idx}_Pass{pass_idx}",
                 "model": model,
+                "static_instruction": chain_config.static_instruction,
                 "instruction": chain_config.get_instruction(chain_idx),
                 "output_schema": chain_config.output_schema,
                 "output_key": pass_output_key,
@@ -214,6 +237,7 @@ class MultiPassRefinementAgent(BaseAgent):
         agent_kwargs = {
             "name": f"{agent_name}Aggregator",
             "model": model,
+            "static_instruction": agg_config.static_instruction,
             "instruction": aggregator_instruction_provider,
             "output_schema": agg_config.output_schema,
             "output_key": output_key,
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+from google.adk.models.base_llm import BaseLlm
 from google.adk.planners.built_in_planner import BuiltInPlanner
 from google.genai import types
 from pydantic import BaseModel
@@ -24,7 +25,9 @@ class MultiPassRefinementLlmAgentConfig:
     get_instruction: Callable  # For chain: Callable[[int], str], For aggregator: Callable[[str], str]
 
     # Optional fields with defaults
-    model: str = GEMINI_PRO
+    model: str | BaseLlm = GEMINI_PRO
+    # Sent as the system instruction; get_instruction then becomes user content
+    static_instruction: str | None = None
     planner: BuiltInPlanner | None = None
     generate_content_config: types.GenerateContentConfig | None = None
 
@@ -56,6 +59,11 @@ class MultiPassRefinementConfig:
     aggregator_config: MultiPassRefinementLlmAgentConfig  # Config for aggregator agent
     extract_findings: Callable[[dict], list[dict]]  # Extract findings from pass output
 
+    # === Optional Domain Logic ===
+    # Applied to the findings of all chains before they are serialized for
+    # the aggregator (e.g. to merge exact duplicates in code)
+    transform_findings: Callable[[list[dict]], list[dict]] | None = None
+
     # === Runtime Parameters ===
     n_parallel_chains: int = 3
     m_sequential_passes: int = 2
@@ -0,0 +1,87 @@
+"""Instruction templates parsed once and rendered from session state.
+
+ADK only substitutes ``{state_key}`` placeholders into plain string
+instructions.  When ``instruction`` is an InstructionProvider (a callable),
+its return value is sent to the model verbatim, so providers that pick
+between prompt variants have to fill in the state values themselves.
+``PromptTemplate`` does that with ADK's substitution rules, but scans the
+template only once (at construction) instead of on every model call.
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+# Same placeholder pattern ADK uses for string instructions
+_PLACEHOLDER = re.compile(r"{+[^{}]*}+")
+_STATE_PREFIXES = ("app:", "user:", "temp:")
+
+
+def _is_state_key(name: str) -> bool:
+    """Return True for ``key`` or ``<prefix>:key`` where key is an identifier."""
+    for prefix in _STATE_PREFIXES:
+        if name.startswith(prefix):
+            name = name.removeprefix(prefix)
+            break
+    return name.isidentifier()
+
+
+class PromptTemplate:
+    """Instruction template split into literal text and state placeholders.
+
+    Rendering follows ADK's rules: ``{key}`` becomes ``str(state[key])``
+    (``None`` renders as an empty string), ``{key?}`` renders as an empty
+    string when the key is missing, and braces that do not name a state key
+    (e.g. JSON examples) are kept as-is.
+
+    Parameters
+    ----------
+    template : str
+        Instruction text containing ``{state_key}`` placeholders.
+    """
+
+    def __init__(self, template: str):
+        parts: list[tuple[str, str | None, bool]] = []
+        literal: list[str] = []
+        last_end = 0
+        for match in _PLACEHOLDER.finditer(template):
+            literal.append(template[last_end : match.start()])
+            last_end = match.end()
+            name = match.group().lstrip("{").rstrip("}").strip()
+            optional = name.endswith("?")
+            name = name.removesuffix("?")
+            if _is_state_key(name):
+                parts.append(("".join(literal), name, optional))
+                literal = []
+            else:
+                literal.append(match.group())
+        literal.append(template[last_end:])
+        parts.append(("".join(literal), None, False))
+        self._parts = tuple(parts)
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """State keys referenced by the template, in order of appearance."""
+        return tuple(key for _, key, _ in self._parts if key is not None)
+
+    def render(self, state: Mapping[str, Any]) -> str:
+        """Fill in the placeholders from ``state``.
+
+        Raises
+        ------
+        KeyError
+            If a non-optional placeholder is missing from ``state``.
+        """
+        pieces: list[str] = []
+        for literal, key, optional in self._parts:
+            pieces.append(literal)
+            if key is None:
+                continue
+            if key not in state:
+                if optional:
+                    continue
+                raise KeyError(f"Context variable not found: `{key}`.")
+            value = state[key]
+            if value is not None:
+                pieces.append(str(value))
+        return "".join(pieces)
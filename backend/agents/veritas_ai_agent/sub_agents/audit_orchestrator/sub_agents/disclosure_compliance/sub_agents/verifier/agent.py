@@ -12,6 +12,7 @@ from veritas_ai_agent.shared.error_handler import default_model_error_handler
 from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
 from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+from veritas_ai_agent.shared.model_utils import as_dict
 
 from ...tools.checklist_loader import load_standard_checklist
 from .prompt import get_verifier_instruction
@@ -27,9 +28,7 @@ def _prepare_work_items(state: dict[str, Any]) -> list[tuple[str, dict]]:
     checklists.  Standards whose checklist cannot be loaded are silently skipped
     with a ``logger.warning``.
     """
-    scanner_output = state.get("disclosure_scanner_output", {})
-    if hasattr(scanner_output, "model_dump"):
-        scanner_output = scanner_output.model_dump()
+    scanner_output = as_dict(state.get("disclosure_scanner_output", {}))
 
     applicable_standards = scanner_output.get("applicable_standards", [])
     if not applicable_standards:
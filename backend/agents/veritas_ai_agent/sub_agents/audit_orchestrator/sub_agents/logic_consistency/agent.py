@@ -3,14 +3,92 @@
 Pipeline:
 1. Detector (MultiPassRefinementAgent): N chains x M passes to find all contradictions
 2. Reviewer (FanOutAgent): Parallel batches to filter false positives and assign severity
+
+Documents shorter than ``LOGIC_CONSISTENCY_FAST_PATH_MAX_CHARS`` characters
+(default 0, i.e. disabled) skip both stages and run a single combined
+detect-and-review call instead.
 """
 
-from google.adk.agents import SequentialAgent
+import logging
+import os
+from collections.abc import AsyncGenerator
+
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+from .sub_agents import detector_agent, fast_path_agent, reviewer_agent
+
+logger = logging.getLogger(__name__)
+
+_FAST_PATH_MAX_CHARS = int(os.environ.get("LOGIC_CONSISTENCY_FAST_PATH_MAX_CHARS", "0"))
+
+
+class LogicConsistencyAgent(BaseAgent):
+    """Routes a document to the full pipeline or the single-call fast path.
+
+    Parameters
+    ----------
+    name : str
+        Agent name
+    full_pipeline : SequentialAgent
+        Detector followed by reviewer
+    fast_path : LlmAgent
+        Combined detect-and-review agent writing the same output key
+    fast_path_max_chars : int
+        Documents with fewer characters use the fast path; 0 disables it
+    """
+
+    full_pipeline: SequentialAgent | None = None
+    fast_path: LlmAgent | None = None
+    fast_path_max_chars: int = 0
+
+    def __init__(
+        self,
+        name: str,
+        full_pipeline: SequentialAgent,
+        fast_path: LlmAgent,
+        fast_path_max_chars: int = 0,
+        description: str = "",
+    ):
+        super().__init__(
+            name=name,
+            description=description,
+            sub_agents=[full_pipeline, fast_path],
+        )
+        self.full_pipeline = full_pipeline
+        self.fast_path = fast_path
+        self.fast_path_max_chars = fast_path_max_chars
+
+    def _select_agent(self, document_markdown: str) -> BaseAgent:
+        assert self.full_pipeline is not None
+        assert self.fast_path is not None
+        if 0 < len(document_markdown) < self.fast_path_max_chars:
+            return self.fast_path
+        return self.full_pipeline
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        document_markdown = ctx.session.state.get("document_markdown", "")
+        agent = self._select_agent(document_markdown)
+        logger.info(
+            "%s: %d-char document routed to %s",
+            self.name,
+            len(document_markdown),
+            agent.name,
+        )
+        async for event in agent.run_async(ctx):
+            yield event
 
-from .sub_agents import detector_agent, reviewer_agent
 
-logic_consistency_agent = SequentialAgent(
+logic_consistency_agent = LogicConsistencyAgent(
     name="LogicConsistency",
     description="Detects and refines semantic contradictions in financial statements",
-    sub_agents=[detector_agent, reviewer_agent],
+    full_pipeline=SequentialAgent(
+        name="LogicConsistencyPipeline",
+        sub_agents=[detector_agent, reviewer_agent],
+    ),
+    fast_path=fast_path_agent,
+    fast_path_max_chars=_FAST_PATH_MAX_CHARS,
 )
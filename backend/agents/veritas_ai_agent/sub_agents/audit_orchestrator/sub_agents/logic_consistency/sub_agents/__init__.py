@@ -1,4 +1,5 @@
 from .detector import detector_agent
+from .fast_path import fast_path_agent
 from .reviewer import reviewer_agent
 
-__all__ = ["detector_agent", "reviewer_agent"]
+__all__ = ["detector_agent", "fast_path_agent", "reviewer_agent"]
@@ -4,6 +4,7 @@ Runs N parallel chains x M sequential passes to maximize finding coverage.
 Each chain explores independently, with later passes finding issues missed earlier.
 """
 
+import os
 from collections.abc import Callable
 
 from google.adk.agents.invocation_context import InvocationContext
@@ -12,16 +13,31 @@ from google.adk.planners.built_in_planner import BuiltInPlanner
 from google.genai import types
 
 from veritas_ai_agent.shared.error_handler import default_model_error_handler
+from veritas_ai_agent.shared.hedged_llm import HedgedGemini
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
+from veritas_ai_agent.shared.llm_response_cache import llm_response_cache
+from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+from veritas_ai_agent.shared.model_utils import as_dict
 from veritas_ai_agent.shared.multi_pass_refinement import MultiPassRefinementAgent
 from veritas_ai_agent.shared.multi_pass_refinement.config import (
     MultiPassRefinementConfig,
     MultiPassRefinementLlmAgentConfig,
 )
+from veritas_ai_agent.shared.prompt_template import PromptTemplate
 
 from . import prompt
 from .schema import LogicConsistencyDetectorOutput
 
+# Race a duplicate request when a Pro call runs well past its usual latency.
+# Opt-in: a hedged call can double the cost and quota of a Pro request.
+_HEDGING_ENABLED = os.environ.get("DETECTOR_HEDGING_ENABLED", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+_FIRST_PASS_TEMPLATE = PromptTemplate(prompt.FIRST_PASS_INSTRUCTION)
+
 
 def _create_config() -> MultiPassRefinementConfig:
     """Create the MultiPassRefinementConfig for the logic consistency detector."""
@@ -30,7 +46,7 @@ def _create_config() -> MultiPassRefinementConfig:
         """Extract the list of findings from a pass output dict."""
         findings = output.get("findings", [])
         # Convert to dict if they're Pydantic models
-        return [f.model_dump() if hasattr(f, "model_dump") else f for f in findings]
+        return [as_dict(f) for f in findings]
 
     def get_pass_instruction_wrapper(
         chain_idx: int,
@@ -39,12 +55,16 @@ def _create_config() -> MultiPassRefinementConfig:
         findings_key = (
             f"LogicConsistencyDetector_chain_{chain_idx}_accumulated_findings"
         )
+        refinement_template = PromptTemplate(
+            prompt.REFINEMENT_INSTRUCTION.replace("CHAIN_IDX", str(chain_idx))
+        )
 
         def instruction_provider(ctx: InvocationContext) -> str:
-            findings = ctx.session.state.get(findings_key, [])
-            if not findings:
-                return prompt.FIRST_PASS_INSTRUCTION
-            return prompt.REFINEMENT_INSTRUCTION.replace("CHAIN_IDX", str(chain_idx))
+            # ADK does not inject state into provider-returned instructions
+            state = ctx.session.state
+            if not state.get(findings_key, []):
+                return _FIRST_PASS_TEMPLATE.render(state)
+            return refinement_template.render(state)
 
         return instruction_provider
 
@@ -62,23 +82,37 @@ def _create_config() -> MultiPassRefinementConfig:
         http_options=types.HttpOptions(retry_options=get_default_retry_config())
     )
 
+    model = HedgedGemini(model=GEMINI_PRO) if _HEDGING_ENABLED else GEMINI_PRO
+
     # Configure the chain agents (the detectors)
     chain_config = MultiPassRefinementLlmAgentConfig(
         output_schema=LogicConsistencyDetectorOutput,
+        model=model,
         get_instruction=get_pass_instruction_wrapper,
-        on_model_error_callback=default_model_error_handler,
+        on_model_error_callback=[
+            llm_response_cache.on_model_error_callback,
+            default_model_error_handler,
+        ],
         planner=planner,
         generate_content_config=generate_content_config,
+        before_model_callback=llm_response_cache.before_model_callback,
+        after_model_callback=llm_response_cache.after_model_callback,
         code_executor=BuiltInCodeExecutor(),
     )
 
     # Configure the aggregator agent
     aggregator_config = MultiPassRefinementLlmAgentConfig(
         output_schema=LogicConsistencyDetectorOutput,
+        model=model,
         get_instruction=get_aggregator_instruction_wrapper,
-        on_model_error_callback=default_model_error_handler,
+        on_model_error_callback=[
+            llm_response_cache.on_model_error_callback,
+            default_model_error_handler,
+        ],
         planner=planner,
         generate_content_config=generate_content_config,
+        before_model_callback=llm_response_cache.before_model_callback,
+        after_model_callback=llm_response_cache.after_model_callback,
     )
 
     return MultiPassRefinementConfig(
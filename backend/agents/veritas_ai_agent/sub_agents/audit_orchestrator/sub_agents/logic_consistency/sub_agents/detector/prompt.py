@@ -1,6 +1,14 @@
-"""Prompts for logic consistency multi-pass refinement."""
+"""Prompts for logic consistency multi-pass refinement.
+
+Every pass instruction is laid out as a static prefix (role, task, examples,
+output format) followed by a pass-specific suffix holding the state
+placeholders. Keeping the variable payload at the end makes the prefix
+byte-identical across chains and passes, so provider-side prompt caching can
+reuse it instead of re-prefilling it on every call. Keep new static text above
+the inputs when editing these prompts.
+"""
 
-# Base instruction template with placeholder for accumulated findings
+# Static instruction shared by every pass; must not contain state placeholders
 PASS_AGENT_BASE_INSTRUCTION = """
 ### Role
 
@@ -11,8 +19,6 @@ You are a logical inconsistencies explorer for financial statements.
 Explore the financial statement for **semantically unreasonable claims** — logic that is implausible or contradictory, even if the math is correct.
 **Prioritize Breadth**: Generate a wide range of potential issues. Do not go deep into verification; other agents will handle validation.
 
-{pass_input_and_instructions}
-
 #### What You Detect
 
 **Business logic contradictions** - claims that violate common sense or business reality, examples:
@@ -105,12 +111,12 @@ FIRST_PASS_CONTENT = """
 REFINEMENT_CONTENT = """
 ### Inputs
 
-**1. Previous Findings (from prior passes)**:
-{LogicConsistencyDetector_chain_CHAIN_IDX_accumulated_findings}
-
-**2. Financial Report**:
+**1. Financial Report**:
 {document_markdown}
 
+**2. Previous Findings (from prior passes)**:
+{LogicConsistencyDetector_chain_CHAIN_IDX_accumulated_findings}
+
 ### Instructions
 
 **Refine and expand on previous findings:**
@@ -119,25 +125,19 @@ REFINEMENT_CONTENT = """
 - **Diversify**: Look for types of contradictions not yet found (e.g., if business logic is covered, look for temporal contradictions).
 """
 
-FIRST_PASS_INSTRUCTION = PASS_AGENT_BASE_INSTRUCTION.format(
-    pass_input_and_instructions=FIRST_PASS_CONTENT.strip()
-)
+FIRST_PASS_INSTRUCTION = PASS_AGENT_BASE_INSTRUCTION + FIRST_PASS_CONTENT
 
-REFINEMENT_INSTRUCTION = PASS_AGENT_BASE_INSTRUCTION.format(
-    pass_input_and_instructions=REFINEMENT_CONTENT.strip()
-)
+REFINEMENT_INSTRUCTION = PASS_AGENT_BASE_INSTRUCTION + REFINEMENT_CONTENT
 
 
-def get_aggregator_instruction(all_findings_json: str) -> str:
-    """Prompt for default aggregator to deduplicate findings from multiple chains."""
-    return f"""
+_AGGREGATOR_INSTRUCTION = """
 ### Role
 
 You are a findings aggregator. Your job is to deduplicate findings from multiple detection chains.
 
 ### All Findings from Multiple Chains
 
-{all_findings_json}
+{findings_placeholder}
 
 ### Your Task
 
@@ -174,3 +174,13 @@ You are a findings aggregator. Your job is to deduplicate findings from multiple
 
 Only deduplicate - do NOT filter out findings. All unique issues should be preserved.
 """
+
+# Split once at import so each call is a plain concatenation
+_AGGREGATOR_PREFIX, _AGGREGATOR_SUFFIX = _AGGREGATOR_INSTRUCTION.split(
+    "{findings_placeholder}"
+)
+
+
+def get_aggregator_instruction(all_findings_json: str) -> str:
+    """Prompt for default aggregator to deduplicate findings from multiple chains."""
+    return "".join((_AGGREGATOR_PREFIX, all_findings_json, _AGGREGATOR_SUFFIX))
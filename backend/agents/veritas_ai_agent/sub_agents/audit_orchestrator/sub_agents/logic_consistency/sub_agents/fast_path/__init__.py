@@ -0,0 +1 @@
+from .agent import fast_path_agent
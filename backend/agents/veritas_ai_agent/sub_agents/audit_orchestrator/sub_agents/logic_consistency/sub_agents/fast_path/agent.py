@@ -0,0 +1,47 @@
+"""Logic Consistency fast path - detection and review in a single LLM call.
+
+Short documents do not need N x M detector passes followed by a reviewer
+fan-out. This agent writes the same ``logic_consistency_reviewer_output`` the
+full pipeline produces, so downstream consumers are unaffected.
+"""
+
+from google.adk.agents import LlmAgent
+from google.adk.code_executors import BuiltInCodeExecutor
+from google.adk.planners.built_in_planner import BuiltInPlanner
+from google.genai import types
+
+from veritas_ai_agent.shared.callbacks import strip_injected_context
+from veritas_ai_agent.shared.error_handler import default_model_error_handler
+from veritas_ai_agent.shared.llm_config import get_default_retry_config
+from veritas_ai_agent.shared.llm_response_cache import llm_response_cache
+from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+
+from ..reviewer.schema import LogicConsistencyReviewerOutput
+from . import prompt
+
+fast_path_agent = LlmAgent(
+    name="LogicConsistencyFastPath",
+    model=GEMINI_PRO,
+    instruction=prompt.INSTRUCTION,
+    include_contents="none",
+    output_key="logic_consistency_reviewer_output",
+    output_schema=LogicConsistencyReviewerOutput,
+    on_model_error_callback=[
+        llm_response_cache.on_model_error_callback,
+        default_model_error_handler,
+    ],
+    before_model_callback=[
+        strip_injected_context,
+        llm_response_cache.before_model_callback,
+    ],
+    after_model_callback=llm_response_cache.after_model_callback,
+    planner=BuiltInPlanner(
+        thinking_config=types.ThinkingConfig(
+            include_thoughts=False, thinking_level="high"
+        )
+    ),
+    generate_content_config=types.GenerateContentConfig(
+        http_options=types.HttpOptions(retry_options=get_default_retry_config())
+    ),
+    code_executor=BuiltInCodeExecutor(),
+)
@@ -1,61 +1,186 @@
-"""Logic Consistency Reviewer — fans out findings into parallel batches."""
+"""Logic Consistency Reviewer — fans out findings into parallel batches.
+
+Batching starts only after the detector has finished. Its findings are not
+final until the detector's aggregator has deduplicated all chains, and that
+aggregator returns one structured output rather than a stream, so reviewing
+earlier partial findings would mean reviewing duplicates.
+"""
 
 import json
+import logging
 import os
+import re
+from functools import cache
 from typing import Any
 
 from google.adk.agents import LlmAgent
+from google.adk.models.google_llm import Gemini
 from google.adk.planners.built_in_planner import BuiltInPlanner
 from google.genai import types
 
 from veritas_ai_agent.shared.error_handler import default_model_error_handler
-from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig
+from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig, chunked
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
-from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+from veritas_ai_agent.shared.llm_response_cache import llm_response_cache
+from veritas_ai_agent.shared.model_name_config import GEMINI_FLASH, GEMINI_PRO
+from veritas_ai_agent.shared.model_utils import as_dict
 
 from .callbacks import strip_injected_context
 from .prompt import get_reviewer_instruction
 from .schema import LogicConsistencyReviewerOutput
 
+logger = logging.getLogger(__name__)
+
 _FINDINGS_BATCH_SIZE = int(os.environ.get("REVIEWER_FINDINGS_BATCH_SIZE", "3"))
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Reviewing is rubric-driven filtering, which Flash handles at a fraction of
+# Pro's cost and latency. REVIEWER_MODEL_ESCALATE switches back to Pro with
+# high thinking, e.g. to check for quality regressions.
+_ESCALATE = os.environ.get("REVIEWER_MODEL_ESCALATE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+_REVIEWER_MODEL = (
+    GEMINI_PRO if _ESCALATE else os.environ.get("REVIEWER_MODEL", GEMINI_FLASH)
+)
+# Fixed thinking level; when unset, each batch gets a level matching its size
+_REVIEWER_THINKING_LEVEL = os.environ.get("REVIEWER_THINKING_LEVEL") or (
+    "high" if _ESCALATE else None
+)
+
+
+def _finding_key(finding: dict) -> tuple[str, str]:
+    """Identity of a finding: its FSLI and whitespace-normalized claim.
+
+    Shared by the pre-review and post-review dedupe so findings kept apart
+    before review are never merged after it.
+    """
+    fsli = str(finding.get("fsli_name", "")).lower().strip()
+    claim = _WHITESPACE_RE.sub(" ", str(finding.get("claim", "")).lower()).strip()
+    return fsli, claim[:200]
+
+
+def _dedupe_findings(findings: list[dict]) -> list[dict]:
+    """Drop findings with the same FSLI and normalized claim, keeping the first.
+
+    Parallel detector chains often surface the same issue; reviewing it once
+    saves a reviewer call per duplicate batch.
+    """
+    seen: dict[tuple[str, str], dict] = {}
+    for finding in findings:
+        seen.setdefault(_finding_key(finding), finding)
+    return list(seen.values())
+
+
+def _thinking_level_for(batch: list[dict]) -> str:
+    """Pick a thinking level from the amount of reasoning a batch carries."""
+    if _REVIEWER_THINKING_LEVEL:
+        return _REVIEWER_THINKING_LEVEL
+    complexity = sum(
+        len(str(f.get("reasoning", ""))) + len(str(f.get("contradiction", "")))
+        for f in batch
+    )
+    if complexity < 1000:
+        return "low"
+    if complexity < 3000:
+        return "medium"
+    return "high"
+
+
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+def _aggregate_reviewed_findings(outputs: list[dict]) -> dict:
+    """Merge batch outputs, keeping the most severe of duplicate findings.
+
+    Batches are reviewed independently, so two of them can confirm the same
+    issue; the copy with the highest severity wins.
+    """
+    seen: dict[tuple[str, str], dict] = {}
+    for output in outputs:
+        for finding in output.get("findings", []):
+            key = _finding_key(finding)
+            rank = _SEVERITY_RANK.get(finding.get("severity"), -1)
+            current = seen.get(key)
+            if current is None or rank > _SEVERITY_RANK.get(
+                current.get("severity"), -1
+            ):
+                seen[key] = finding
+    return {"findings": list(seen.values())}
+
+
+@cache
+def _planner_for_level(thinking_level: str) -> BuiltInPlanner:
+    """Return the shared planner for a thinking level.
+
+    Batch agents only read their planner, so one instance per level is reused
+    across batches instead of building a planner per fan-out item.
+    """
+    return BuiltInPlanner(
+        thinking_config=types.ThinkingConfig(
+            include_thoughts=False, thinking_level=thinking_level
+        )
+    )
 
 
 def _prepare_work_items(state: dict[str, Any]) -> list[list[dict]]:
     """Read detector findings from state and chunk into batches."""
-    detector_output = state.get("logic_consistency_detector_output", {})
-    if hasattr(detector_output, "model_dump"):
-        detector_output = detector_output.model_dump()
+    detector_output = as_dict(state.get("logic_consistency_detector_output", {}))
 
     findings = detector_output.get("findings", [])
     if not findings:
         return []
 
-    # Chunk findings into batches
-    batches = []
-    for i in range(0, len(findings), _FINDINGS_BATCH_SIZE):
-        batches.append(findings[i : i + _FINDINGS_BATCH_SIZE])
-    return batches
+    unique_findings = _dedupe_findings(findings)
+    deduped_count = len(findings) - len(unique_findings)
+    if deduped_count:
+        logger.info(
+            "Dropped %d duplicate detector findings before review (%d remain).",
+            deduped_count,
+            len(unique_findings),
+        )
+    return list(chunked(unique_findings, _FINDINGS_BATCH_SIZE))
+
+
+# Shared configuration for every batch agent. Cloning it per batch avoids
+# rebuilding the generation config for each fan-out item; planners are
+# shared per thinking level via _planner_for_level. The
+# model is a Gemini instance rather than a name: ADK resolves a name to a new
+# client on every call, while one instance keeps a single API client and its
+# connection pool for all batches.
+_REVIEWER_TEMPLATE = LlmAgent(
+    name="LogicConsistencyReviewerBatch",
+    model=Gemini(model=_REVIEWER_MODEL),
+    include_contents="none",
+    output_schema=LogicConsistencyReviewerOutput,
+    on_model_error_callback=[
+        llm_response_cache.on_model_error_callback,
+        default_model_error_handler,
+    ],
+    before_model_callback=[
+        strip_injected_context,
+        llm_response_cache.before_model_callback,
+    ],
+    after_model_callback=llm_response_cache.after_model_callback,
+    generate_content_config=types.GenerateContentConfig(
+        http_options=types.HttpOptions(retry_options=get_default_retry_config())
+    ),
+)
 
 
 def _create_reviewer_agent(index: int, batch: list[dict], output_key: str) -> LlmAgent:
     """Create a reviewer LlmAgent for one batch of findings."""
-    return LlmAgent(
-        name=f"LogicConsistencyReviewerBatch_{index}",
-        model=GEMINI_PRO,
-        instruction=get_reviewer_instruction(json.dumps(batch, indent=2)),
-        include_contents="none",
-        output_key=output_key,
-        output_schema=LogicConsistencyReviewerOutput,
-        on_model_error_callback=default_model_error_handler,
-        before_model_callback=strip_injected_context,
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=False, thinking_level="high"
-            )
-        ),
-        generate_content_config=types.GenerateContentConfig(
-            http_options=types.HttpOptions(retry_options=get_default_retry_config())
-        ),
+    return _REVIEWER_TEMPLATE.clone(
+        update={
+            "name": f"LogicConsistencyReviewerBatch_{index}",
+            "instruction": get_reviewer_instruction(
+                json.dumps(batch, separators=(",", ":"), ensure_ascii=False)
+            ),
+            "output_key": output_key,
+            "planner": _planner_for_level(_thinking_level_for(batch)),
+        }
     )
 
 
@@ -64,6 +189,7 @@ reviewer_agent = FanOutAgent(
     config=FanOutConfig(
         prepare_work_items=_prepare_work_items,
         create_agent=_create_reviewer_agent,
+        aggregate=_aggregate_reviewed_findings,
         output_key="logic_consistency_reviewer_output",
         results_field="findings",
         empty_message="No detector findings to review.",
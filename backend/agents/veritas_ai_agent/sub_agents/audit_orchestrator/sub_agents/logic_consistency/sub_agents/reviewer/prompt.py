@@ -1,16 +1,16 @@
+"""Prompts for the logic consistency reviewer.
+
+The instruction is a static prefix (role, tasks, examples) followed by the
+inputs. The document comes before the batch findings so every reviewer batch
+shares the longest possible identical prefix, which is what provider-side
+prompt caching keys on. Keep placeholders out of ``_ROLE_AND_TASKS``.
+"""
+
 _ROLE_AND_TASKS = """
 ### Role
 
 You are a logic consistency reviewer. Your job is to filter false positives from potential logic inconsistencies and assign business-impact severity.
 
-### Inputs
-
-**1. Detector Findings to Review**:
-{findings_placeholder}
-
-**2. Financial Report**:
-{document_markdown}
-
 ### Your Tasks
 
 1. **Filter False Positives**: For each finding, determine if it's a real issue or false positive:
@@ -79,6 +79,21 @@ You are a logic consistency reviewer. Your job is to filter false positives from
 -> **Severity**: HIGH (going concern risk if cash burn continues)
 """
 
+_INPUTS = """
+### Inputs
+
+**1. Financial Report**:
+{document_markdown}
+
+**2. Detector Findings to Review**:
+{findings_placeholder}
+"""
+
+# Split once at import so each batch is a single join, not a scan of the
+# whole template (join sizes the result once instead of copying the findings
+# through an intermediate string)
+_PREFIX, _SUFFIX = (_ROLE_AND_TASKS + _INPUTS).split("{findings_placeholder}")
+
 
 def get_reviewer_instruction(findings_json: str) -> str:
     """Build reviewer instruction with a specific subset of findings baked in.
@@ -86,4 +101,4 @@ def get_reviewer_instruction(findings_json: str) -> str:
     The ``{document_markdown}`` placeholder is left intact — ADK auto-substitutes
     it from session state at runtime.
     """
-    return _ROLE_AND_TASKS.replace("{findings_placeholder}", findings_json)
+    return "".join((_PREFIX, findings_json, _SUFFIX))
@@ -23,7 +23,11 @@ class TargetCell(BaseModel):
 
 
 class InferredFormula(BaseModel):
-    """One candidate formula for a calculable cell."""
+    """One candidate formula for a calculable cell.
+
+    Kept as an object rather than a bare string so that live runs match the
+    ``{"formula": ...}`` shape stored in recorded pipeline fixtures.
+    """
 
     formula: str = Field(
         description="Evaluable formula string (e.g. sum_col(0, 1, 2, 4))"
@@ -46,3 +50,8 @@ class ReconstructedFormula(BaseModel):
 
     check_type: Literal["in_table", "cross_table"]
     inferred_formulas: Optional[list[InferredFormula]] = None
+
+    # In-table fields
+    table_index: Optional[int] = None
+    target_cells: Optional[list[TargetCell]] = None
+    actual_value: Optional[float] = None
@@ -30,6 +30,9 @@ logger = logging.getLogger(__name__)
 # rounding noise and suppressed.
 DIFFERENCE_THRESHOLD = 1.0
 
+# Fields shared by every cross-table issue
+_CROSS_TABLE_ISSUE_BASE = {"check_type": "cross_table", "actual_value": 0.0}
+
 
 # ---------------------------------------------------------------------------
 # Before-agent callback  (formula execution)
@@ -107,6 +110,14 @@ def _evaluate_in_table(
     if isinstance(table_index, int):
         table_name = table_names.get(table_index, table_name)
 
+    # Fields shared by every issue of this entry, built once
+    base = {
+        "check_type": "in_table",
+        "table_index": table_index,
+        "table_name": table_name,
+        "actual_value": actual_value,
+    }
+
     issues: list[dict] = []
     for inferred in entry.get("inferred_formulas", []):
         formula = _extract_formula_string(inferred)
@@ -119,12 +130,9 @@ def _evaluate_in_table(
         if abs(difference) >= DIFFERENCE_THRESHOLD:
             issues.append(
                 {
-                    "check_type": "in_table",
-                    "table_index": table_index,
-                    "table_name": table_name,
+                    **base,
                     "formula": formula,
                     "calculated_value": calculated,
-                    "actual_value": actual_value,
                     "difference": difference,
                 }
             )
@@ -155,10 +163,9 @@ def _evaluate_cross_table(
         if abs(difference) >= DIFFERENCE_THRESHOLD:
             issues.append(
                 {
-                    "check_type": "cross_table",
+                    **_CROSS_TABLE_ISSUE_BASE,
                     "formula": formula,
                     "calculated_value": difference,
-                    "actual_value": 0.0,
                     "difference": difference,
                 }
             )
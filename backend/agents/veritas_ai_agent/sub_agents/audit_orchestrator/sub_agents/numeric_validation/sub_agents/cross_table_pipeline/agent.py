@@ -7,11 +7,19 @@ Architecture
       │   ├─ BalanceSheetCrossTableInconsistencyDetector     (1x3 MultiPassRefinementAgent)
       │   ├─ IncomeStatementCrossTableInconsistencyDetector  (1x3 MultiPassRefinementAgent)
       │   └─ CashFlowCrossTableInconsistencyDetector         (2x3 MultiPassRefinementAgent)
-      └─ CrossTableReviewer           (FanOutAgent, max 5 findings/batch)
+      └─ CrossTableReviewer           (FanOutAgent, max 15 findings/batch)
+
+All detector chains run in parallel, and all reviewer batches run
+concurrently, capped process-wide by ``FANOUT_MAX_CONCURRENCY``.
+
+Documents with fewer than two extracted tables skip the pipeline entirely.
+Otherwise the tables are rendered once as compact markdown grids
+(``extracted_tables_compact``) for all detector and reviewer prompts.
 """
 
 from google.adk.agents import ParallelAgent, SequentialAgent
 
+from .callbacks import skip_without_multiple_tables, store_compact_tables
 from .sub_agents.detectors import (
     balance_sheet_detector_agent,
     cash_flow_detector_agent,
@@ -32,4 +40,5 @@ cross_table_pipeline_agent = SequentialAgent(
         ),
         reviewer_agent,
     ],
+    before_agent_callback=[skip_without_multiple_tables, store_compact_tables],
 )
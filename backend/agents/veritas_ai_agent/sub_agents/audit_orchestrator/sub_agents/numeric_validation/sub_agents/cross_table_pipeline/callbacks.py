@@ -0,0 +1,41 @@
+"""Callbacks for the cross-table pipeline."""
+
+import logging
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+from .table_format import format_tables_compact
+
+logger = logging.getLogger(__name__)
+
+
+async def skip_without_multiple_tables(
+    callback_context: CallbackContext,
+) -> types.Content | None:
+    """Skip the pipeline when the document has fewer than two tables.
+
+    A cross-table discrepancy needs at least two tables, so the detectors and
+    reviewer could only return empty results.  The reviewer output is written
+    as empty so downstream readers see the same shape as a normal run.
+    """
+    tables = callback_context.state.get("extracted_tables", {}).get("tables", [])
+    if len(tables) >= 2:
+        return None
+
+    logger.info("Skipping cross-table checks: %d table(s) extracted.", len(tables))
+    callback_context.state["cross_table_reviewer_output"] = {"findings": []}
+    return types.Content(
+        role="model",
+        parts=[types.Part(text="Fewer than two tables; no cross-table checks run.")],
+    )
+
+
+async def store_compact_tables(callback_context: CallbackContext) -> None:
+    """Render the extracted tables once for every cross-table prompt.
+
+    Writes ``extracted_tables_compact`` (markdown grids), which the detector
+    and reviewer prompts embed instead of the JSON envelope.
+    """
+    tables = callback_context.state.get("extracted_tables", {}).get("tables", [])
+    callback_context.state["extracted_tables_compact"] = format_tables_compact(tables)
@@ -9,15 +9,59 @@ from google.genai import types
 
 from veritas_ai_agent.shared.error_handler import default_model_error_handler
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
+from veritas_ai_agent.shared.model_utils import as_dict
 from veritas_ai_agent.shared.multi_pass_refinement import MultiPassRefinementAgent
 from veritas_ai_agent.shared.multi_pass_refinement.config import (
     MultiPassRefinementConfig,
     MultiPassRefinementLlmAgentConfig,
 )
+from veritas_ai_agent.shared.prompt_template import PromptTemplate
 
-from .prompt import get_aggregator_instruction
+from .prompt import DETECTOR_STATIC_INSTRUCTION, get_aggregator_instruction
 from .schema import CrossTableDetectorOutput
 
+# Immutable model settings shared by every detector built by the factory
+_PLANNER = BuiltInPlanner(
+    thinking_config=types.ThinkingConfig(include_thoughts=False, thinking_level="high")
+)
+_GENERATE_CONTENT_CONFIG = types.GenerateContentConfig(
+    http_options=types.HttpOptions(retry_options=get_default_retry_config())
+)
+
+
+def _finding_key(finding: dict) -> tuple[str, str, str]:
+    """Normalized identity of a finding (case- and whitespace-insensitive)."""
+    return tuple(
+        str(finding.get(field, "")).strip().lower()
+        for field in ("fsli_name", "statement_type", "discrepancy")
+    )
+
+
+def _dedup_findings(findings: list[dict]) -> list[dict]:
+    """Merge findings that are exact duplicates after normalization.
+
+    Chains often report the very same discrepancy; merging those here keeps
+    the aggregator LLM for the near-duplicates it is actually needed for.
+    Per key the finding with the longest ``reasoning`` is kept and the
+    ``source_refs`` of all copies are combined (first-seen order).
+    """
+    merged: dict[tuple[str, str, str], dict] = {}
+    for finding in findings:
+        key = _finding_key(finding)
+        kept = merged.get(key)
+        if kept is None:
+            merged[key] = finding
+            continue
+        refs = list(
+            dict.fromkeys(
+                [*kept.get("source_refs", []), *finding.get("source_refs", [])]
+            )
+        )
+        if len(finding.get("reasoning", "")) > len(kept.get("reasoning", "")):
+            kept = finding
+        merged[key] = {**kept, "source_refs": refs}
+    return list(merged.values())
+
 
 def create_cross_table_detector(
     agent_name: str,
@@ -36,9 +80,9 @@ def create_cross_table_detector(
     output_key : str
         State key to write final output (e.g., "balance_sheet_cross_table_inconsistency_detector_output")
     first_pass_instruction : str
-        Prompt for the first pass (should contain {extracted_tables} placeholder)
+        Prompt for the first pass (should contain {extracted_tables_compact} placeholder)
     refinement_instruction : str
-        Prompt for refinement passes (should contain {AgentName_chain_CHAIN_IDX_accumulated_findings} and {extracted_tables})
+        Prompt for refinement passes (should contain {AgentName_chain_CHAIN_IDX_accumulated_findings} and {extracted_tables_compact})
     n_parallel_chains : int
         Number of parallel chains to run (default: 1)
     m_sequential_passes : int
@@ -52,36 +96,39 @@ def create_cross_table_detector(
 
     def extract_findings(output: dict) -> list[dict]:
         findings = output.get("findings", [])
-        return [f.model_dump() if hasattr(f, "model_dump") else f for f in findings]
+        # Outputs come from one model_dump, so the findings are either all
+        # dicts (the usual case) or all models
+        if not findings or isinstance(findings[0], dict):
+            return findings
+        return [as_dict(f) for f in findings]
+
+    # ADK does not inject state into provider-returned instructions, so the
+    # templates are parsed once here and rendered by the provider itself
+    first_pass_template = PromptTemplate(first_pass_instruction)
 
     def get_pass_instruction(
         chain_idx: int,
     ) -> Callable[[InvocationContext], str]:
         findings_key = f"{agent_name}_chain_{chain_idx}_accumulated_findings"
+        refinement_template = PromptTemplate(
+            refinement_instruction.replace("CHAIN_IDX", str(chain_idx))
+        )
 
         def instruction_provider(ctx: InvocationContext) -> str:
-            findings = ctx.session.state.get(findings_key, [])
-            if not findings:
-                return first_pass_instruction
-            return refinement_instruction.replace("CHAIN_IDX", str(chain_idx))
+            state = ctx.session.state
+            if not state.get(findings_key, []):
+                return first_pass_template.render(state)
+            return refinement_template.render(state)
 
         return instruction_provider
 
-    planner = BuiltInPlanner(
-        thinking_config=types.ThinkingConfig(
-            include_thoughts=False, thinking_level="high"
-        )
-    )
-    generate_content_config = types.GenerateContentConfig(
-        http_options=types.HttpOptions(retry_options=get_default_retry_config())
-    )
-
     chain_config = MultiPassRefinementLlmAgentConfig(
         output_schema=CrossTableDetectorOutput,
+        static_instruction=DETECTOR_STATIC_INSTRUCTION,
         get_instruction=get_pass_instruction,
         on_model_error_callback=default_model_error_handler,
-        planner=planner,
-        generate_content_config=generate_content_config,
+        planner=_PLANNER,
+        generate_content_config=_GENERATE_CONTENT_CONFIG,
         code_executor=BuiltInCodeExecutor(),
     )
 
@@ -89,14 +136,15 @@ def create_cross_table_detector(
         output_schema=CrossTableDetectorOutput,
         get_instruction=get_aggregator_instruction,
         on_model_error_callback=default_model_error_handler,
-        planner=planner,
-        generate_content_config=generate_content_config,
+        planner=_PLANNER,
+        generate_content_config=_GENERATE_CONTENT_CONFIG,
     )
 
     config = MultiPassRefinementConfig(
         chain_agent_config=chain_config,
         aggregator_config=aggregator_config,
         extract_findings=extract_findings,
+        transform_findings=_dedup_findings,
         n_parallel_chains=n_parallel_chains,
         m_sequential_passes=m_sequential_passes,
     )
@@ -3,140 +3,122 @@
 All prompts are placeholders — to be refined with domain-specific instructions.
 """
 
-# ---------------------------------------------------------------------------
-# Balance Sheet
-# ---------------------------------------------------------------------------
-
-BS_FIRST_PASS_INSTRUCTION = """
+# The role and general rules are shared by all three statement types and go
+# in the system instruction (DETECTOR_STATIC_INSTRUCTION).  Each per-pass
+# prompt then opens with the extracted tables, identical for every detector,
+# chain and pass, before the statement-specific instructions.  Refinement
+# prompts only *append* the previous findings, so every call shares the
+# longest possible byte-identical prefix for the provider's prompt cache.
+
+DETECTOR_STATIC_INSTRUCTION = """
 ### Role
-You are a cross-table balance sheet discrepancy detector for financial statements.
+You are a cross-table discrepancy detector for financial statements. Each
+request names the statement type to focus on.
 
-### Inputs
-**Extracted Tables**:
-{extracted_tables}
+### General Rules
+- Only report line items that should reconcile across tables but do not.
+- Use python for all arithmetic — never calculate manually.
+"""
 
-### Instructions
-Scan all tables for balance-sheet line items that should reconcile across
-tables (e.g., total assets appearing in both the balance sheet and notes).
-Report any discrepancies you find.
+_TABLES_SECTION = """
+### Extracted Tables
+One markdown grid per table; the first row and column hold cell indices.
 
-Use python for all arithmetic — never calculate manually.
+{extracted_tables_compact}
 """
 
-BS_REFINEMENT_INSTRUCTION = """
-### Role
-You are a cross-table balance sheet discrepancy detector for financial statements.
-
-### Inputs
-**Previous Findings (from prior passes)**:
-{BalanceSheetCrossTableInconsistencyDetector_chain_CHAIN_IDX_accumulated_findings}
 
-**Extracted Tables**:
-{extracted_tables}
+def _refinement_tail(agent_name: str) -> str:
+    """Volatile suffix appended to a first-pass prompt for refinement passes."""
+    return f"""
+### Previous Findings (from prior passes)
+{{{agent_name}_chain_CHAIN_IDX_accumulated_findings}}
 
-### Instructions
-Refine and expand on previous findings:
+### Refinement
+Refine and expand on the previous findings:
 - **Avoid Duplicates**: Do not repeat findings listed above.
 - **Find New Angles**: Focus on different line items or unexplored tables.
-
-Use python for all arithmetic — never calculate manually.
 """
 
+
 # ---------------------------------------------------------------------------
-# Income Statement
+# Balance Sheet
 # ---------------------------------------------------------------------------
 
-IS_FIRST_PASS_INSTRUCTION = """
-### Role
-You are a cross-table income statement discrepancy detector for financial statements.
-
-### Inputs
-**Extracted Tables**:
-{extracted_tables}
+BS_FIRST_PASS_INSTRUCTION = (
+    _TABLES_SECTION
+    + """
+### Statement Type
+Balance Sheet
 
 ### Instructions
-Scan all tables for income-statement line items that should reconcile across
-tables (e.g., revenue, COGS, operating profit appearing in multiple places).
+Scan all tables for balance-sheet line items that should reconcile across
+tables (e.g., total assets appearing in both the balance sheet and notes).
 Report any discrepancies you find.
-
-Use python for all arithmetic — never calculate manually.
 """
+)
 
-IS_REFINEMENT_INSTRUCTION = """
-### Role
-You are a cross-table income statement discrepancy detector for financial statements.
+BS_REFINEMENT_INSTRUCTION = BS_FIRST_PASS_INSTRUCTION + _refinement_tail(
+    "BalanceSheetCrossTableInconsistencyDetector"
+)
 
-### Inputs
-**Previous Findings (from prior passes)**:
-{IncomeStatementCrossTableInconsistencyDetector_chain_CHAIN_IDX_accumulated_findings}
+# ---------------------------------------------------------------------------
+# Income Statement
+# ---------------------------------------------------------------------------
 
-**Extracted Tables**:
-{extracted_tables}
+IS_FIRST_PASS_INSTRUCTION = (
+    _TABLES_SECTION
+    + """
+### Statement Type
+Income Statement
 
 ### Instructions
-Refine and expand on previous findings:
-- **Avoid Duplicates**: Do not repeat findings listed above.
-- **Find New Angles**: Focus on different line items or unexplored tables.
-
-Use python for all arithmetic — never calculate manually.
+Scan all tables for income-statement line items that should reconcile across
+tables (e.g., revenue, COGS, operating profit appearing in multiple places).
+Report any discrepancies you find.
 """
+)
+
+IS_REFINEMENT_INSTRUCTION = IS_FIRST_PASS_INSTRUCTION + _refinement_tail(
+    "IncomeStatementCrossTableInconsistencyDetector"
+)
 
 # ---------------------------------------------------------------------------
 # Cash Flow
 # ---------------------------------------------------------------------------
 
-CF_FIRST_PASS_INSTRUCTION = """
-### Role
-You are a cross-table cash flow discrepancy detector for financial statements.
-
-### Inputs
-**Extracted Tables**:
-{extracted_tables}
+CF_FIRST_PASS_INSTRUCTION = (
+    _TABLES_SECTION
+    + """
+### Statement Type
+Cash Flow Statement
 
 ### Instructions
 Scan all tables for cash-flow line items that should reconcile across tables
 (e.g., net income flowing from income statement, ending cash matching balance
 sheet). Report any discrepancies you find.
-
-Use python for all arithmetic — never calculate manually.
-"""
-
-CF_REFINEMENT_INSTRUCTION = """
-### Role
-You are a cross-table cash flow discrepancy detector for financial statements.
-
-### Inputs
-**Previous Findings (from prior passes)**:
-{CashFlowCrossTableInconsistencyDetector_chain_CHAIN_IDX_accumulated_findings}
-
-**Extracted Tables**:
-{extracted_tables}
-
-### Instructions
-Refine and expand on previous findings:
-- **Avoid Duplicates**: Do not repeat findings listed above.
-- **Find New Angles**: Focus on different line items or unexplored tables.
-
-Use python for all arithmetic — never calculate manually.
 """
+)
 
+CF_REFINEMENT_INSTRUCTION = CF_FIRST_PASS_INSTRUCTION + _refinement_tail(
+    "CashFlowCrossTableInconsistencyDetector"
+)
 
 # ---------------------------------------------------------------------------
 # Aggregator (shared across all detector types)
 # ---------------------------------------------------------------------------
 
 
-def get_aggregator_instruction(all_findings_json: str) -> str:
-    """Prompt for the aggregator that deduplicates findings from multiple chains."""
-    return f"""
+_AGGREGATOR_INSTRUCTION = """
 ### Role
 You are a findings aggregator for cross-table discrepancies.
 
 ### All Findings from Multiple Chains
-{all_findings_json}
+{findings_placeholder}
 
 ### Your Task
 **Deduplicate**: Merge findings that describe the same discrepancy.
+Exact duplicates (same fsli_name, statement_type and discrepancy) are already merged.
 
 1. **Identify duplicates** by comparing fsli_name, statement_type, and discrepancy.
 2. **When merging**: keep the most detailed reasoning and combine source_refs.
@@ -144,3 +126,13 @@ You are a findings aggregator for cross-table discrepancies.
 
 Do NOT filter out findings. All unique issues should be preserved.
 """
+
+# Split once at import so each call is a plain concatenation
+_AGGREGATOR_PREFIX, _AGGREGATOR_SUFFIX = _AGGREGATOR_INSTRUCTION.split(
+    "{findings_placeholder}"
+)
+
+
+def get_aggregator_instruction(all_findings_json: str) -> str:
+    """Prompt for the aggregator that deduplicates findings from multiple chains."""
+    return "".join((_AGGREGATOR_PREFIX, all_findings_json, _AGGREGATOR_SUFFIX))
@@ -1,7 +1,9 @@
 """Cross-Table Reviewer — fans out findings into parallel batches."""
 
 import json
+import logging
 import os
+from itertools import chain
 from typing import Any
 
 from google.adk.agents import LlmAgent
@@ -11,14 +13,50 @@ from google.genai import types
 
 from veritas_ai_agent.shared.callbacks import strip_injected_context
 from veritas_ai_agent.shared.error_handler import default_model_error_handler
-from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig
+from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig, chunked
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
 from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+from veritas_ai_agent.shared.model_utils import as_dict
 
 from .prompt import get_reviewer_instruction
 from .schema import CrossTableReviewerOutput
 
-_FINDINGS_BATCH_SIZE = int(os.environ.get("CROSS_TABLE_REVIEWER_BATCH_SIZE", "5"))
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BATCH_SIZE = 15
+_MAX_BATCH_SIZE = 100
+
+
+def _batch_size_from_env() -> int:
+    """Read CROSS_TABLE_REVIEWER_BATCH_SIZE, clamped to 1.._MAX_BATCH_SIZE.
+
+    A malformed value falls back to the default instead of failing the
+    import of the whole agent tree.
+    """
+    raw = os.environ.get("CROSS_TABLE_REVIEWER_BATCH_SIZE", str(_DEFAULT_BATCH_SIZE))
+    try:
+        size = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid CROSS_TABLE_REVIEWER_BATCH_SIZE %r; using %d.",
+            raw,
+            _DEFAULT_BATCH_SIZE,
+        )
+        return _DEFAULT_BATCH_SIZE
+    return max(1, min(_MAX_BATCH_SIZE, size))
+
+
+# Every batch repeats the full tables and the role prompt, which dwarf a single
+# finding, so larger batches mean far fewer calls for the same work.
+_FINDINGS_BATCH_SIZE = _batch_size_from_env()
+
+# Shared by every batch agent instead of being rebuilt per batch
+_PLANNER = BuiltInPlanner(
+    thinking_config=types.ThinkingConfig(include_thoughts=False, thinking_level="high")
+)
+_GENERATE_CONTENT_CONFIG = types.GenerateContentConfig(
+    http_options=types.HttpOptions(retry_options=get_default_retry_config())
+)
 
 _DETECTOR_OUTPUT_KEYS = [
     "balance_sheet_cross_table_inconsistency_detector_output",
@@ -29,22 +67,15 @@ _DETECTOR_OUTPUT_KEYS = [
 
 def _prepare_work_items(state: dict[str, Any]) -> list[list[dict]]:
     """Read findings from all 3 detector outputs and chunk into batches."""
-    all_findings: list[dict] = []
-
+    findings_per_detector = []
     for key in _DETECTOR_OUTPUT_KEYS:
-        detector_output = state.get(key, {})
-        if hasattr(detector_output, "model_dump"):
-            detector_output = detector_output.model_dump()
-        findings = detector_output.get("findings", [])
-        all_findings.extend(findings)
+        detector_output = as_dict(state.get(key, {}))
+        findings_per_detector.append(detector_output.get("findings", []))
 
-    if not all_findings:
-        return []
-
-    batches = []
-    for i in range(0, len(all_findings), _FINDINGS_BATCH_SIZE):
-        batches.append(all_findings[i : i + _FINDINGS_BATCH_SIZE])
-    return batches
+    # Batch straight across the detector lists without concatenating them
+    return list(
+        chunked(chain.from_iterable(findings_per_detector), _FINDINGS_BATCH_SIZE)
+    )
 
 
 def _create_reviewer_agent(index: int, batch: list[dict], output_key: str) -> LlmAgent:
@@ -52,21 +83,17 @@ def _create_reviewer_agent(index: int, batch: list[dict], output_key: str) -> Ll
     return LlmAgent(
         name=f"CrossTableReviewerBatch_{index}",
         model=GEMINI_PRO,
-        instruction=get_reviewer_instruction(json.dumps(batch, indent=2)),
+        instruction=get_reviewer_instruction(
+            json.dumps(batch, separators=(",", ":"), ensure_ascii=False)
+        ),
         include_contents="none",
         output_key=output_key,
         output_schema=CrossTableReviewerOutput,
         on_model_error_callback=default_model_error_handler,
         before_model_callback=strip_injected_context,
         code_executor=BuiltInCodeExecutor(),
-        planner=BuiltInPlanner(
-            thinking_config=types.ThinkingConfig(
-                include_thoughts=False, thinking_level="high"
-            )
-        ),
-        generate_content_config=types.GenerateContentConfig(
-            http_options=types.HttpOptions(retry_options=get_default_retry_config())
-        ),
+        planner=_PLANNER,
+        generate_content_config=_GENERATE_CONTENT_CONFIG,
     )
 
 
@@ -9,14 +9,6 @@ _REVIEWER_INSTRUCTION = """
 You are a cross-table discrepancy reviewer. Your job is to filter false
 positives and assign business-impact severity to cross-table findings.
 
-### Inputs
-
-**Findings to Review**:
-{findings_placeholder}
-
-**Extracted Tables**:
-{extracted_tables}
-
 ### Your Tasks
 
 1. **Filter False Positives**: Remove findings that are not genuine
@@ -35,13 +27,30 @@ positives and assign business-impact severity to cross-table findings.
 
 - **No new detection**: Only review provided findings — don't look for new issues.
 - **Use python for math**: Never calculate manually.
+
+### Extracted Tables
+
+One markdown grid per table; the first row and column hold cell indices.
+
+{extracted_tables_compact}
+
+### Findings to Review
+
+{findings_placeholder}
 """
 
+# Split once at import so each batch is a plain concatenation rather than a
+# scan of the whole template
+_PREFIX, _SUFFIX = _REVIEWER_INSTRUCTION.split("{findings_placeholder}")
+
 
 def get_reviewer_instruction(findings_json: str) -> str:
     """Build reviewer instruction with a specific batch of findings baked in.
 
-    The ``{extracted_tables}`` placeholder is left intact — ADK auto-substitutes
+    The findings are the only part that differs between batches, so they sit
+    at the end of the template after the shared instructions and tables.
+
+    The ``{extracted_tables_compact}`` placeholder is left intact — ADK auto-substitutes
     it from session state at runtime.
     """
-    return _REVIEWER_INSTRUCTION.replace("{findings_placeholder}", findings_json)
+    return "".join((_PREFIX, findings_json, _SUFFIX))
@@ -0,0 +1,41 @@
+"""Compact text rendering of the extracted tables for cross-table prompts.
+
+The cross-table detectors and reviewer embed every table in every call.  As
+JSON each cell costs quotes and commas and every table repeats its keys; a
+markdown grid carries the same cells in noticeably fewer tokens.
+"""
+
+
+def _format_cell(value: object) -> str:
+    """Render one grid cell: whole floats without ``.0``, ``None`` as empty."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).replace("|", "\\|")
+
+
+def format_tables_compact(tables: list[dict]) -> str:
+    """Render tables as markdown grids, one titled block per table.
+
+    Grids already carry index headers (row 0 and column 0 hold the cell
+    indices), so the first grid row becomes the markdown header row.
+
+    Parameters
+    ----------
+    tables : list[dict]
+        Entries of ``extracted_tables["tables"]`` with ``table_index``,
+        ``table_name`` and ``grid``.
+    """
+    blocks: list[str] = []
+    for table in tables:
+        lines = [
+            f"#### Table {table.get('table_index')}: {table.get('table_name', '')}"
+        ]
+        grid = table.get("grid") or []
+        for row_idx, row in enumerate(grid):
+            lines.append("| " + " | ".join(_format_cell(c) for c in row) + " |")
+            if row_idx == 0:
+                lines.append("|" + "---|" * len(row))
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
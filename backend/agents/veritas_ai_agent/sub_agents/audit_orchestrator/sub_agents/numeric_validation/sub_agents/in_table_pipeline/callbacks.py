@@ -23,11 +23,20 @@ State keys written
     - inferred_formulas: list of {"formula": str}
 """
 
+import json
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import chain
 
 from google.adk.agents.callback_context import CallbackContext
 
-from .formula_replicator import detect_replication_direction, replicate_formulas
+from veritas_ai_agent.shared.model_utils import as_dict
+
+from .formula_replicator import (
+    NumericMasks,
+    detect_replication_direction,
+    iter_replicated_formulas,
+)
 from .sub_agents.logic_reconciliation_check.sub_agents.fan_out.schema import (
     LogicInferredFormula,
 )
@@ -51,15 +60,15 @@ _DYNAMIC_DIRECTION_KEYS: list[str] = [
 
 
 def _dedup_formulas(
-    formulas: list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula],
-) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
-    """Remove duplicate formulas by (table_index, row_index, col_index, formula_string).
+    formulas: Iterable[HorizontalVerticalCheckInferredFormula | LogicInferredFormula],
+) -> Iterator[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
+    """Yield formulas unique by (table_index, row_index, col_index, formula_string).
 
     Duplicate entries arise when vertical check and logic reconciliation both
-    produce the same formula for the same target cell.
+    produce the same formula for the same target cell.  Items are yielded as
+    they are checked so the caller can write them out without a second list.
     """
     seen: set[tuple[int, int, int, str]] = set()
-    result: list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula] = []
     for item in formulas:
         target = item.target_cell
         f_str = (
@@ -68,8 +77,38 @@ def _dedup_formulas(
         key = (target.table_index, target.row_index, target.col_index, f_str)
         if key not in seen:
             seen.add(key)
-            result.append(item)
-    return result
+            yield item
+
+
+def _claim_anchor(
+    item: HorizontalVerticalCheckInferredFormula | LogicInferredFormula,
+    direction: str,
+    seen: set[tuple],
+) -> bool:
+    """Record an anchor for replication; False if it was already recorded.
+
+    The checks often return the same anchor, and every copy would otherwise
+    be replicated across the whole table only for ``_dedup_formulas`` to
+    drop the repeated output.  The direction is part of the key because the
+    same anchor replicated the other way yields different formulas.
+    """
+    target = item.target_cell
+    formulas = (
+        tuple(item.formulas)
+        if isinstance(item, LogicInferredFormula)
+        else (item.formula,)
+    )
+    key = (
+        direction,
+        target.table_index,
+        target.row_index,
+        target.col_index,
+        formulas,
+    )
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
 
 
 def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
@@ -79,8 +118,6 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
     extracted = state.get("extracted_tables", {})
     if isinstance(extracted, str):
         try:
-            import json
-
             extracted = json.loads(extracted)
         except json.JSONDecodeError:
             extracted = {}
@@ -91,12 +128,16 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
         state.setdefault("reconstructed_formulas", [])
         return
 
-    # 1 & 2. Collect raw formulas and replicate them
-    all_replicated: list[
-        HorizontalVerticalCheckInferredFormula | LogicInferredFormula
+    # 1 & 2. Collect raw formulas and set up their (lazy) replication; the
+    # replicas are produced while step 3 consumes them, never all at once
+    replicated_streams: list[
+        Iterator[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]
     ] = []
     # Make sure we use a dict for fast lookup
     table_grids = {t.get("table_index"): t.get("grid") for t in tables}
+    # Shared by every replication below, so each table is classified once
+    numeric_masks = NumericMasks(table_grids)
+    seen_anchors: set[tuple] = set()
 
     # Iterate over both fixed and dynamic keys
     all_keys = list(_FIXED_DIRECTION_KEYS.keys()) + _DYNAMIC_DIRECTION_KEYS
@@ -105,15 +146,23 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
         output = state.get(key)
         if not output:
             continue
-        if hasattr(output, "model_dump"):
-            output = output.model_dump()
+        # ADK stores outputs as dicts; a model output is read through its
+        # attributes instead of being dumped and validated all over again
+        if isinstance(output, dict):
+            items = output.get("formulas", [])
+        else:
+            items = getattr(output, "formulas", None) or []
 
         batch_formulas: list[
             HorizontalVerticalCheckInferredFormula | LogicInferredFormula
         ] = []
-        for item in output.get("formulas", []):
-            if hasattr(item, "model_dump"):
-                item = item.model_dump()
+        for item in items:
+            if isinstance(
+                item, HorizontalVerticalCheckInferredFormula | LogicInferredFormula
+            ):
+                batch_formulas.append(item)
+                continue
+            item = as_dict(item)
 
             try:
                 if isinstance(item, dict):
@@ -134,13 +183,21 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
         if batch_formulas:
             if key in _FIXED_DIRECTION_KEYS:
                 # Existing path: single direction for the whole batch
-                all_replicated.extend(
-                    replicate_formulas(
-                        batch_formulas,
-                        table_grids,
-                        direction=_FIXED_DIRECTION_KEYS[key],
+                direction = _FIXED_DIRECTION_KEYS[key]
+                anchors = [
+                    f
+                    for f in batch_formulas
+                    if _claim_anchor(f, direction, seen_anchors)
+                ]
+                if anchors:
+                    replicated_streams.append(
+                        iter_replicated_formulas(
+                            anchors,
+                            table_grids,
+                            direction=direction,
+                            numeric_masks=numeric_masks,
+                        )
                     )
-                )
             else:
                 # Dynamic path: detect direction per formula from sum_cells cell layout
                 for formula_item in batch_formulas:
@@ -155,18 +212,26 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
                             f_str,
                         )
                         continue
-                    all_replicated.extend(
-                        replicate_formulas(
-                            [formula_item], table_grids, direction=direction
+                    if not _claim_anchor(formula_item, direction, seen_anchors):
+                        continue
+                    replicated_streams.append(
+                        iter_replicated_formulas(
+                            [formula_item],
+                            table_grids,
+                            direction=direction,
+                            numeric_masks=numeric_masks,
                         )
                     )
 
-    replicated = _dedup_formulas(all_replicated)
-
-    # 3. Look up actual values and write to shared state
-    state.setdefault("reconstructed_formulas", [])
+    # Nothing to add (common for clean documents): leave existing entries
+    # untouched rather than copying them into a fresh list
+    if not replicated_streams:
+        state.setdefault("reconstructed_formulas", [])
+        return
 
-    for item in replicated:
+    # 3. Look up actual values, deduplicating on the fly
+    new_entries: list[dict] = []
+    for item in _dedup_formulas(chain.from_iterable(replicated_streams)):
         target = item.target_cell
         t_idx = target.table_index
         row = target.row_index
@@ -195,7 +260,7 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
                 t_idx,
                 e,
             )
-        state["reconstructed_formulas"].append(
+        new_entries.append(
             {
                 "check_type": "in_table",
                 "table_index": t_idx,
@@ -217,3 +282,10 @@ def after_in_table_parallel_callback(callback_context: CallbackContext) -> None:
                 ],
             }
         )
+
+    # 4. Write to shared state with a single assignment. Appending in place to
+    # a list that is already in state would not be recorded as a state delta.
+    state["reconstructed_formulas"] = [
+        *state.get("reconstructed_formulas", []),
+        *new_entries,
+    ]
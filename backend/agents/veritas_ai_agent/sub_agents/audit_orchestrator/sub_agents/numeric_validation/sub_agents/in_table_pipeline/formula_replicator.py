@@ -26,15 +26,18 @@ Supported formulas
 Design notes
 ------------
 * Uses regex to parse formula patterns
-* Validates numeric columns/rows before replication
+* Validates numeric columns/rows before replication, against per-table
+  numeric masks (``NumericMasks``) built once from the grids
 * Maintains deduplication via (target_cell, formula) keys
 * Compound arithmetic formulas (cell() OP cell()) are replicated by
-  shifting column/row indices in each cell() reference via re.sub,
-  preserving operators and formula structure.
+  shifting column/row indices in each cell() reference via a %-template
+  built once per anchor, preserving operators and formula structure.
 """
 
 import logging
 import re
+from collections.abc import Iterator
+from itertools import compress, zip_longest
 from typing import Any
 
 from .schema import TargetCell
@@ -62,10 +65,75 @@ CELL_FUNC_PATTERN = re.compile(r"cell\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)"
 def _make_formula_item(
     target: TargetCell, formula: str, as_multi: bool
 ) -> HorizontalVerticalCheckInferredFormula | LogicInferredFormula:
-    """Create the appropriate formula item type based on as_multi flag."""
+    """Create the appropriate formula item type based on as_multi flag.
+
+    Items are built with ``model_construct`` (no validation): target and
+    formula come from already-validated anchors or are generated here.
+    LLM output is validated once, in the in-table callback.
+    """
     if as_multi:
-        return LogicInferredFormula(target_cell=target, formulas=[formula])
-    return HorizontalVerticalCheckInferredFormula(target_cell=target, formula=formula)
+        return LogicInferredFormula.model_construct(
+            target_cell=target, formulas=[formula]
+        )
+    return HorizontalVerticalCheckInferredFormula.model_construct(
+        target_cell=target, formula=formula
+    )
+
+
+class NumericMasks(dict):
+    """Per-table grids of ``_is_numeric`` flags, built on first access.
+
+    Replication scans the same cells again for every candidate column or
+    row.  Testing each cell once and scanning plain bools lets ``any()``
+    read them directly, without a Python call per cell.  Missing or empty
+    grids map to ``None``.
+
+    Parameters
+    ----------
+    table_grids : dict[int, list[list[Any]]]
+        Table index to grid, as stored in ``extracted_tables``.
+    """
+
+    def __init__(self, table_grids: dict[int, list[list[Any]]]):
+        super().__init__()
+        self._table_grids = table_grids
+        self._span_columns: dict[tuple[int, int, int], list[bool]] = {}
+        self._row_bits: dict[int, list[int]] = {}
+
+    def __missing__(self, t_idx: int) -> list[list[bool]] | None:
+        grid = self._table_grids.get(t_idx)
+        mask = [[_is_numeric(v) for v in row] for row in grid] if grid else None
+        self[t_idx] = mask
+        return mask
+
+    def numeric_columns(self, t_idx: int, r1: int, r2: int) -> list[bool]:
+        """Per column of table ``t_idx``: any number in rows ``r1..r2``?
+
+        Memoized per span: anchors of one table often sum the same rows
+        (e.g. one total given for several target columns), and the span is
+        then scanned once for all of them.  The table's mask must exist.
+        """
+        key = (t_idx, r1, r2)
+        columns = self._span_columns.get(key)
+        if columns is None:
+            columns = _columns_numeric_in_range(self[t_idx], r1, r2)
+            self._span_columns[key] = columns
+        return columns
+
+    def row_bits(self, t_idx: int) -> list[int]:
+        """Rows of table ``t_idx`` as bitmaps: bit ``c`` set if column c is numeric.
+
+        Testing a row against a set of columns is then a single ``&``
+        however many columns are involved.  The table's mask must exist.
+        """
+        bits = self._row_bits.get(t_idx)
+        if bits is None:
+            bits = [
+                sum(1 << c for c, numeric in enumerate(row) if numeric)
+                for row in self[t_idx]
+            ]
+            self._row_bits[t_idx] = bits
+        return bits
 
 
 def replicate_formulas(
@@ -78,15 +146,30 @@ def replicate_formulas(
     Handles both single-formula (InferredFormula) and multi-formula (LogicInferredFormula) inputs.
     Returns list of same type as input, including originals and replicated copies.
     """
+    return list(iter_replicated_formulas(formulas, table_grids, direction))
+
+
+def iter_replicated_formulas(
+    formulas: list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula],
+    table_grids: dict[int, list[list[Any]]],
+    direction: str = "vertical",
+    numeric_masks: NumericMasks | None = None,
+) -> Iterator[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
+    """Lazy variant of ``replicate_formulas``.
+
+    Yields each original and replicated item as soon as it is produced, so a
+    consumer can process results without the full list being built first.
+    Callers replicating several batches over the same grids can share one
+    ``numeric_masks`` so each table is classified only once.
+    """
     if not formulas:
-        return []
+        return
+    masks = numeric_masks if numeric_masks is not None else NumericMasks(table_grids)
 
     # Detect input type from first item
     is_multi = hasattr(formulas[0], "formulas")
-    replicated_results: list[
-        HorizontalVerticalCheckInferredFormula | LogicInferredFormula
-    ] = []
-    seen_keys: set[tuple] = set()
+    # Flat (table, row, col, formula) keys: no inner tuple per check
+    seen_keys: set[tuple[int, int, int, str]] = set()
 
     for item in formulas:
         # Add the original formula first
@@ -98,21 +181,17 @@ def replicate_formulas(
 
         # Since we want to return the same type, let's process each formula in the item
         for f_str in f_list:
-            key = ((target.table_index, target.row_index, target.col_index), f_str)
+            key = (target.table_index, target.row_index, target.col_index, f_str)
             if key not in seen_keys:
-                replicated_results.append(_make_formula_item(target, f_str, is_multi))
                 seen_keys.add(key)
+                yield _make_formula_item(target, f_str, is_multi)
 
             # Replicate
             new_items = []
             if direction == "vertical":
-                new_items = _replicate_vertical_str(
-                    f_str, target, table_grids, is_multi
-                )
+                new_items = _replicate_vertical_str(f_str, target, masks, is_multi)
             elif direction == "horizontal":
-                new_items = _replicate_horizontal_str(
-                    f_str, target, table_grids, is_multi
-                )
+                new_items = _replicate_horizontal_str(f_str, target, masks, is_multi)
 
             for new_item in new_items:
                 if is_multi and isinstance(new_item, LogicInferredFormula):
@@ -123,50 +202,44 @@ def replicate_formulas(
                     continue
                 new_target = new_item.target_cell
                 k = (
-                    (
-                        new_target.table_index,
-                        new_target.row_index,
-                        new_target.col_index,
-                    ),
+                    new_target.table_index,
+                    new_target.row_index,
+                    new_target.col_index,
                     new_f,
                 )
                 if k not in seen_keys:
-                    replicated_results.append(new_item)
                     seen_keys.add(k)
+                    yield new_item
 
-    return replicated_results
 
-
-def _all_refs_same_column(formula: str) -> bool:
+def _all_refs_same_column(cells: list[tuple[str, str, str]]) -> bool:
     """Check if all (t, r, c) references in formula share the same column.
 
     Works for both sum_cells() and compound cell() arithmetic formulas,
     since CELL_REF_PATTERN matches the (t, r, c) triplet inside either
     ``sum_cells((0, 1, 2), ...)`` or ``cell(0, 1, 2) + cell(...)``.
+    ``cells`` is that pattern's ``findall`` result for the formula.
 
     Requires 2+ refs to be meaningful for direction detection.
     """
-    cells = CELL_REF_PATTERN.findall(formula)
     if not cells or len(cells) < 2:
         return False
-    cols = {int(c[2]) for c in cells}
-    return len(cols) == 1
+    # Stop at the first ref in another column instead of collecting them all
+    col = int(cells[0][2])
+    return all(int(c[2]) == col for c in cells[1:])
 
 
-def _all_refs_same_row(formula: str) -> bool:
+def _all_refs_same_row(cells: list[tuple[str, str, str]]) -> bool:
     """Check if all (t, r, c) references in formula share the same row.
 
-    Works for both sum_cells() and compound cell() arithmetic formulas,
-    since CELL_REF_PATTERN matches the (t, r, c) triplet inside either
-    ``sum_cells((0, 1, 2), ...)`` or ``cell(0, 1, 2) + cell(...)``.
+    See ``_all_refs_same_column``; takes the same ``findall`` result.
 
     Requires 2+ refs to be meaningful for direction detection.
     """
-    cells = CELL_REF_PATTERN.findall(formula)
     if not cells or len(cells) < 2:
         return False
-    rows = {int(c[1]) for c in cells}
-    return len(rows) == 1
+    row = int(cells[0][1])
+    return all(int(c[1]) == row for c in cells[1:])
 
 
 def detect_replication_direction(
@@ -182,9 +255,11 @@ def detect_replication_direction(
         formula = item.formula
     target = item.target_cell
 
-    if _all_refs_same_column(formula):
+    # Tokenize the refs once for both layout checks
+    cells = CELL_REF_PATTERN.findall(formula)
+    if _all_refs_same_column(cells):
         return "vertical"
-    if _all_refs_same_row(formula):
+    if _all_refs_same_row(cells):
         return "horizontal"
 
     # Default single cell reference logic checks to vertical replication
@@ -208,50 +283,64 @@ def detect_replication_direction(
 
 
 def _replicate_vertical_str(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Replicate column-based formulas to other numeric columns."""
     # Handle sum_col(t, col, r1, r2)
     match = SUM_COL_PATTERN.match(formula)
     if match:
         t_idx, anchor_col, r1, r2 = map(int, match.groups())
-        grid = table_grids.get(t_idx)
-        if not grid:
+        mask = masks[t_idx]
+        if not mask:
             return []
 
         results = []
-        num_cols = len(grid[0]) if grid else 0
-
-        for c in range(anchor_col + 1, num_cols):
-            if _is_column_numeric_in_range(grid, c, r1, r2):
-                new_formula = f"sum_col({t_idx}, {c}, {r1}, {r2})"
-                new_target = TargetCell(
-                    table_index=target.table_index,
-                    row_index=target.row_index,
-                    col_index=c,
-                )
-                results.append(_make_formula_item(new_target, new_formula, as_multi))
+        num_cols = len(mask[0]) if mask else 0
+        # Flag the columns with a number in the span in one pass over it,
+        # then visit only those instead of scanning the span per candidate
+        numeric_cols = masks.numeric_columns(t_idx, r1, r2)
+        candidates = range(anchor_col + 1, num_cols)
+        # Only the column varies: fill a template built once (%-formatting
+        # a single int is cheaper than rebuilding the f-string)
+        formula_tmpl = f"sum_col({t_idx}, %d, {r1}, {r2})"
+
+        for c in compress(candidates, numeric_cols[anchor_col + 1 :]):
+            new_formula = formula_tmpl % c
+            new_target = TargetCell.model_construct(
+                table_index=target.table_index,
+                row_index=target.row_index,
+                col_index=c,
+            )
+            results.append(_make_formula_item(new_target, new_formula, as_multi))
         return results
 
     # Handle cell(t, r, c) - single cell logic replication
     match = CELL_FUNC_PATTERN.fullmatch(formula)
     if match:
         t_src, r_src, c_src = map(int, match.groups())
-        grid = table_grids.get(t_src)
-        if not grid:
+        mask = masks[t_src]
+        if not mask:
             return []
 
         results = []
-        num_cols = len(grid[0]) if grid else 0
+        num_cols = len(mask[0]) if mask else 0
         anchor_col = target.col_index
+        formula_tmpl = f"cell({t_src}, {r_src}, %d)"
+        # The source row's numeric columns as one bitmap (clipped to the
+        # table width): each candidate is a single bit test
+        src_bits = (
+            masks.row_bits(t_src)[r_src] & _bit_range(0, num_cols - 1)
+            if r_src < len(mask)
+            else 0
+        )
 
         for c in range(anchor_col + 1, num_cols):
             offset = c - anchor_col
             new_src_col = c_src + offset
 
-            if _is_column_numeric_in_range(grid, new_src_col, r_src, r_src):
-                new_formula = f"cell({t_src}, {r_src}, {new_src_col})"
-                new_target = TargetCell(
+            if src_bits >> new_src_col & 1:
+                new_formula = formula_tmpl % new_src_col
+                new_target = TargetCell.model_construct(
                     table_index=target.table_index,
                     row_index=target.row_index,
                     col_index=c,
@@ -261,31 +350,35 @@ def _replicate_vertical_str(
 
     # Handle sum_cells((t,r,c), ...) for vertical patterns
     if SUM_CELLS_PATTERN.match(formula):
-        return _replicate_vertical_sum_cells_str(formula, target, table_grids, as_multi)
+        return _replicate_vertical_sum_cells_str(formula, target, masks, as_multi)
 
     # Handle compound arithmetic: cell(...) + cell(...) - cell(...) etc.
-    return _replicate_arithmetic_vertical(formula, target, table_grids, as_multi)
+    return _replicate_arithmetic_vertical(formula, target, masks, as_multi)
 
 
 def _replicate_horizontal_str(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Replicate row-based formulas to other rows."""
     # Handle sum_row(t, row, c1, c2)
     match = SUM_ROW_PATTERN.match(formula)
     if match:
         t_idx, anchor_row, c1, c2 = map(int, match.groups())
-        grid = table_grids.get(t_idx)
-        if not grid:
+        mask = masks[t_idx]
+        if not mask:
             return []
 
         results = []
-        num_rows = len(grid)
+        num_rows = len(mask)
+        formula_tmpl = f"sum_row({t_idx}, %d, {c1}, {c2})"
+        row_bits = masks.row_bits(t_idx)
+        # Clamp to the widest row: c2 comes from the model and sizes the int
+        span_bits = _bit_range(max(0, c1), min(c2, max(map(len, mask)) - 1))
 
         for r in range(anchor_row + 1, num_rows):
-            if _is_row_numeric_in_range(grid, r, c1, c2):
-                new_formula = f"sum_row({t_idx}, {r}, {c1}, {c2})"
-                new_target = TargetCell(
+            if row_bits[r] & span_bits:
+                new_formula = formula_tmpl % r
+                new_target = TargetCell.model_construct(
                     table_index=target.table_index,
                     row_index=r,
                     col_index=target.col_index,
@@ -297,21 +390,23 @@ def _replicate_horizontal_str(
     match = CELL_FUNC_PATTERN.fullmatch(formula)
     if match:
         t_src, r_src, c_src = map(int, match.groups())
-        grid = table_grids.get(t_src)
-        if not grid:
+        mask = masks[t_src]
+        if not mask:
             return []
 
         results = []
-        num_rows = len(grid)
+        num_rows = len(mask)
         anchor_row = target.row_index
+        formula_tmpl = f"cell({t_src}, %d, {c_src})"
+        row_bits = masks.row_bits(t_src)
 
         for r in range(anchor_row + 1, num_rows):
             offset = r - anchor_row
             new_src_row = r_src + offset
 
-            if _is_row_numeric_in_range(grid, new_src_row, c_src, c_src):
-                new_formula = f"cell({t_src}, {new_src_row}, {c_src})"
-                new_target = TargetCell(
+            if new_src_row < num_rows and row_bits[new_src_row] >> c_src & 1:
+                new_formula = formula_tmpl % new_src_row
+                new_target = TargetCell.model_construct(
                     table_index=target.table_index,
                     row_index=r,
                     col_index=target.col_index,
@@ -321,24 +416,22 @@ def _replicate_horizontal_str(
 
     # Handle sum_cells((t,r,c), ...) for horizontal patterns
     if SUM_CELLS_PATTERN.match(formula):
-        return _replicate_horizontal_sum_cells_str(
-            formula, target, table_grids, as_multi
-        )
+        return _replicate_horizontal_sum_cells_str(formula, target, masks, as_multi)
 
     # Handle compound arithmetic: cell(...) + cell(...) - cell(...) etc.
-    return _replicate_arithmetic_horizontal(formula, target, table_grids, as_multi)
+    return _replicate_arithmetic_horizontal(formula, target, masks, as_multi)
 
 
 # --- Compound arithmetic replication ---
 
 
 def _replicate_arithmetic_vertical(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Replicate compound arithmetic formulas across columns.
 
-    Uses re.sub to shift column indices in all cell() references while
-    preserving operators (+, -, *, /) and formula structure (parentheses).
+    Shifts the column index in all cell() references while preserving
+    operators (+, -, *, /) and formula structure (parentheses).
 
     Requirements for replication:
     - Formula must contain 2+ cell() references
@@ -355,46 +448,41 @@ def _replicate_arithmetic_vertical(
         return []
 
     anchor_col = target.col_index
-
-    # Determine max columns from referenced table grids
-    max_cols = 0
-    for m in refs:
-        t_idx = int(m.group(1))
-        grid = table_grids.get(t_idx)
-        if grid and grid[0]:
-            max_cols = max(max_cols, len(grid[0]))
-    if max_cols == 0:
+    ref_col = next(iter(cols))
+    # Parse the refs once and turn the formula into a %-template with one
+    # field per ref for the shared column, so each candidate column costs one
+    # formatting call instead of a regex substitution plus int() per ref
+    cells = [tuple(map(int, m.groups())) for m in refs]
+    template = CELL_FUNC_PATTERN.sub(
+        lambda m: f"cell({m.group(1)}, {m.group(2)}, %d)",
+        formula.replace("%", "%%"),
+    )
+
+    # Resolve each ref's table and its dimensions once, not per candidate:
+    # every shifted ref must stay inside its table (below the narrowest
+    # width) and at least one must land on a number
+    ref_masks = [masks[t_idx] for t_idx, _, _ in cells]
+    if not all(ref_masks):
         return []
+    widths = [len(mask[0]) for mask in ref_masks]
+    max_cols = max(widths)
+    min_width = min(widths)
+    ref_rows = [
+        mask[r]
+        for mask, (_, r, _) in zip(ref_masks, cells, strict=True)
+        if r < len(mask)
+    ]
 
     results = []
     for c in range(anchor_col + 1, max_cols):
-        offset = c - anchor_col
-
-        # Validate: all shifted refs in bounds, at least one numeric
-        valid = True
-        any_numeric = False
-        for m in refs:
-            t_idx = int(m.group(1))
-            r = int(m.group(2))
-            new_c = int(m.group(3)) + offset
-            grid = table_grids.get(t_idx)
-            if not grid or new_c >= len(grid[0]):
-                valid = False
-                break
-            if r < len(grid) and _is_numeric(grid[r][new_c]):
-                any_numeric = True
-
-        if not valid or not any_numeric:
+        new_c = ref_col + c - anchor_col
+        if new_c >= min_width or not any(row[new_c] for row in ref_rows):
             continue
 
         # Shift column index in every cell() reference, preserving everything else
-        new_formula = CELL_FUNC_PATTERN.sub(
-            lambda m,
-            _o=offset: f"cell({m.group(1)}, {m.group(2)}, {int(m.group(3)) + _o})",
-            formula,
-        )
+        new_formula = template % ((new_c,) * len(cells))
 
-        new_target = TargetCell(
+        new_target = TargetCell.model_construct(
             table_index=target.table_index,
             row_index=target.row_index,
             col_index=c,
@@ -405,12 +493,12 @@ def _replicate_arithmetic_vertical(
 
 
 def _replicate_arithmetic_horizontal(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Replicate compound arithmetic formulas across rows.
 
-    Uses re.sub to shift row indices in all cell() references while
-    preserving operators (+, -, *, /) and formula structure (parentheses).
+    Shifts the row index in all cell() references while preserving
+    operators (+, -, *, /) and formula structure (parentheses).
 
     Requirements for replication:
     - Formula must contain 2+ cell() references
@@ -427,46 +515,34 @@ def _replicate_arithmetic_horizontal(
         return []
 
     anchor_row = target.row_index
-
-    # Determine max rows from referenced table grids
-    max_rows = 0
-    for m in refs:
-        t_idx = int(m.group(1))
-        grid = table_grids.get(t_idx)
-        if grid:
-            max_rows = max(max_rows, len(grid))
-    if max_rows == 0:
+    ref_row = next(iter(rows))
+    # Parse once and template the shared row (see the vertical variant)
+    cells = [tuple(map(int, m.groups())) for m in refs]
+    template = CELL_FUNC_PATTERN.sub(
+        lambda m: f"cell({m.group(1)}, %d, {m.group(3)})",
+        formula.replace("%", "%%"),
+    )
+
+    # Resolve tables and heights once (see the vertical variant); each ref's
+    # numeric test is a bit of its table's row bitmaps
+    ref_masks = [masks[t_idx] for t_idx, _, _ in cells]
+    if not all(ref_masks):
         return []
+    heights = [len(mask) for mask in ref_masks]
+    max_rows = max(heights)
+    min_height = min(heights)
+    ref_bits = [(masks.row_bits(t_idx), c) for t_idx, _, c in cells]
 
     results = []
     for r in range(anchor_row + 1, max_rows):
-        offset = r - anchor_row
-
-        # Validate: all shifted refs in bounds, at least one numeric
-        valid = True
-        any_numeric = False
-        for m in refs:
-            t_idx = int(m.group(1))
-            new_r = int(m.group(2)) + offset
-            c = int(m.group(3))
-            grid = table_grids.get(t_idx)
-            if not grid or new_r >= len(grid):
-                valid = False
-                break
-            if c < len(grid[new_r]) and _is_numeric(grid[new_r][c]):
-                any_numeric = True
-
-        if not valid or not any_numeric:
+        new_r = ref_row + r - anchor_row
+        if new_r >= min_height or not any(bits[new_r] >> c & 1 for bits, c in ref_bits):
             continue
 
         # Shift row index in every cell() reference, preserving everything else
-        new_formula = CELL_FUNC_PATTERN.sub(
-            lambda m,
-            _o=offset: f"cell({m.group(1)}, {int(m.group(2)) + _o}, {m.group(3)})",
-            formula,
-        )
+        new_formula = template % ((new_r,) * len(cells))
 
-        new_target = TargetCell(
+        new_target = TargetCell.model_construct(
             table_index=target.table_index,
             row_index=r,
             col_index=target.col_index,
@@ -480,7 +556,7 @@ def _replicate_arithmetic_horizontal(
 
 
 def _replicate_vertical_sum_cells_str(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Handle sum_cells((t,r1,c), (t,r2,c)...) - all same column."""
     cells = CELL_REF_PATTERN.findall(formula)
@@ -497,18 +573,28 @@ def _replicate_vertical_sum_cells_str(
     anchor_col = next(iter(cols))
     rows = [int(c[1]) for c in cells]
 
-    grid = table_grids.get(t_idx)
-    if not grid:
+    mask = masks[t_idx]
+    if not mask:
         return []
 
     results = []
-    num_cols = len(grid[0]) if grid else 0
+    num_rows = len(mask)
+    num_cols = len(mask[0]) if mask else 0
+    # Only the column changes between candidates: build the cell list once
+    # and fill in the column with a single %-formatting call per candidate
+    template = "sum_cells(" + ", ".join(f"({t_idx}, {r}, %d)" for r in rows) + ")"
+    # OR the referenced rows' bitmaps once: a candidate column is valid when
+    # its bit is set, with no per-candidate scan over the rows
+    row_bits = masks.row_bits(t_idx)
+    rows_bits = 0
+    for r in rows:
+        if r < num_rows:
+            rows_bits |= row_bits[r]
 
     for c in range(anchor_col + 1, num_cols):
-        if _are_rows_valid_for_col(grid, c, rows):
-            parts = [f"({t_idx}, {r}, {c})" for r in rows]
-            new_formula = f"sum_cells({', '.join(parts)})"
-            new_target = TargetCell(
+        if rows_bits >> c & 1:
+            new_formula = template % ((c,) * len(rows))
+            new_target = TargetCell.model_construct(
                 table_index=target.table_index,
                 row_index=target.row_index,
                 col_index=c,
@@ -519,7 +605,7 @@ def _replicate_vertical_sum_cells_str(
 
 
 def _replicate_horizontal_sum_cells_str(
-    formula: str, target: TargetCell, table_grids: dict, as_multi: bool
+    formula: str, target: TargetCell, masks: NumericMasks, as_multi: bool
 ) -> list[HorizontalVerticalCheckInferredFormula | LogicInferredFormula]:
     """Handle sum_cells((t,r,c1), (t,r,c2)...) - all same row."""
     cells = CELL_REF_PATTERN.findall(formula)
@@ -536,18 +622,27 @@ def _replicate_horizontal_sum_cells_str(
     anchor_row = next(iter(rows_set))
     cols = [int(c[2]) for c in cells]
 
-    grid = table_grids.get(t_idx)
-    if not grid:
+    mask = masks[t_idx]
+    if not mask:
         return []
 
     results = []
-    num_rows = len(grid)
+    num_rows = len(mask)
+    # Only the row changes between candidates (see the vertical variant)
+    template = "sum_cells(" + ", ".join(f"({t_idx}, %d, {c})" for c in cols) + ")"
+    row_bits = masks.row_bits(t_idx)
+    # Columns past the widest row are never numeric; skipping them also keeps
+    # a model-supplied index from sizing the bitmap
+    width = max(map(len, mask))
+    cols_bits = 0
+    for c in cols:
+        if c < width:
+            cols_bits |= 1 << c
 
     for r in range(anchor_row + 1, num_rows):
-        if _are_cols_valid_for_row(grid, r, cols):
-            parts = [f"({t_idx}, {r}, {c})" for c in cols]
-            new_formula = f"sum_cells({', '.join(parts)})"
-            new_target = TargetCell(
+        if row_bits[r] & cols_bits:
+            new_formula = template % ((r,) * len(cols))
+            new_target = TargetCell.model_construct(
                 table_index=target.table_index,
                 row_index=r,
                 col_index=target.col_index,
@@ -561,42 +656,24 @@ def _replicate_horizontal_sum_cells_str(
 
 
 def _is_numeric(val: Any) -> bool:
-    return isinstance(val, (int, float))
-
-
-def _is_column_numeric_in_range(grid: list, col: int, r1: int, r2: int) -> bool:
-    if not grid or col >= len(grid[0]):
-        return False
-    for r in range(max(0, r1), min(len(grid), r2 + 1)):
-        if _is_numeric(grid[r][col]):
-            return True
-    return False
+    # Exact type check: cheaper than isinstance, and bool (an int subclass)
+    # is a flag, not an amount
+    t = type(val)
+    return t is int or t is float
 
 
-def _is_row_numeric_in_range(grid: list, row: int, c1: int, c2: int) -> bool:
-    if row >= len(grid):
-        return False
-    row_data = grid[row]
-    for c in range(max(0, c1), min(len(row_data), c2 + 1)):
-        if _is_numeric(row_data[c]):
-            return True
-    return False
-
+def _columns_numeric_in_range(mask: list, r1: int, r2: int) -> list[bool]:
+    """Flag, per column, whether any row in ``r1..r2`` holds a number there.
 
-def _are_rows_valid_for_col(grid: list, col: int, rows: list[int]) -> bool:
-    if not grid or col >= len(grid[0]):
-        return False
-    for r in rows:
-        if r < len(grid) and _is_numeric(grid[r][col]):
-            return True
-    return False
+    Flags span the widest row; cells missing from short (ragged) rows count
+    as non-numeric.
+    """
+    span = mask[max(0, r1) : r2 + 1]
+    return list(map(any, zip_longest(*span, fillvalue=False)))
 
 
-def _are_cols_valid_for_row(grid: list, row: int, cols: list[int]) -> bool:
-    if row >= len(grid):
-        return False
-    row_data = grid[row]
-    for c in cols:
-        if c < len(row_data) and _is_numeric(row_data[c]):
-            return True
-    return False
+def _bit_range(lo: int, hi: int) -> int:
+    """Bitmap with bits ``lo..hi`` (inclusive) set; 0 for an empty range."""
+    if hi < lo:
+        return 0
+    return ((1 << (hi - lo + 1)) - 1) << lo
@@ -1,4 +1,4 @@
-"""Logic Reconciliation Check Fan-Out Agent — fans out per candidate table."""
+"""Logic Reconciliation Check Fan-Out Agent — fans out batches of candidate tables."""
 
 import json
 from typing import Any
@@ -11,16 +11,29 @@ from veritas_ai_agent.shared.error_handler import default_model_error_handler
 from veritas_ai_agent.shared.fan_out import FanOutAgent, FanOutConfig
 from veritas_ai_agent.shared.llm_config import get_default_retry_config
 from veritas_ai_agent.shared.model_name_config import GEMINI_PRO
+from veritas_ai_agent.shared.model_utils import as_dict
+from veritas_ai_agent.sub_agents.audit_orchestrator.sub_agents.numeric_validation.sub_agents.in_table_pipeline.sub_agents.vertical_horizontal_check.utils import (
+    chunk_tables,
+)
 
 from .prompt import get_table_instruction
 from .schema import LogicCheckAgentOutput
 
+# Tables per LLM call.  Every call repeats the full instruction, so candidate
+# tables share a call; the cap keeps the prompt (and the high-effort
+# reasoning over it) bounded when the screener flags many tables.
+_MAX_TABLES_PER_CALL = 5
+
+# Built once and reused for every batch; compact separators keep the
+# envelope (and the prompt) small
+_BATCH_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
 
-def _prepare_work_items(state: dict[str, Any]) -> list[dict]:
-    """Read screener output and return candidate tables for fan-out."""
-    screener_output = state.get("logic_reconciliation_check_screener_output", {})
-    if hasattr(screener_output, "model_dump"):
-        screener_output = screener_output.model_dump()
+
+def _prepare_work_items(state: dict[str, Any]) -> list[list[dict]]:
+    """Read screener output and return batches of candidate tables for fan-out."""
+    screener_output = as_dict(
+        state.get("logic_reconciliation_check_screener_output", {})
+    )
 
     candidates = screener_output.get("candidate_table_indexes", [])
 
@@ -38,20 +51,19 @@ def _prepare_work_items(state: dict[str, Any]) -> list[dict]:
         all_tables if isinstance(all_tables, list) else all_tables.get("tables", [])
     )
 
-    candidate_tables = []
-    for idx in candidates:
-        matching_table = next(
-            (t for t in tables_list if t.get("table_index") == idx), None
-        )
-        if matching_table:
-            candidate_tables.append(matching_table)
+    # Index once instead of scanning every table per candidate; reversed so
+    # the first table wins if an index is ever repeated
+    tables_by_index = {t.get("table_index"): t for t in reversed(tables_list)}
+    candidate_tables = [
+        tables_by_index[idx] for idx in candidates if idx in tables_by_index
+    ]
 
-    return candidate_tables
+    return chunk_tables(candidate_tables, max_size=_MAX_TABLES_PER_CALL)
 
 
 def _create_table_agent(index: int, work_item: Any, output_key: str) -> LlmAgent:
-    """Create a check agent for a specific candidate table."""
-    table_envelope = json.dumps({"tables": [work_item]})
+    """Create a check agent for a batch of candidate tables."""
+    table_envelope = _BATCH_ENCODER.encode({"tables": work_item})
     return LlmAgent(
         name=f"LogicReconciliationFormulaInfererTableAgent_{index}",
         model=GEMINI_PRO,
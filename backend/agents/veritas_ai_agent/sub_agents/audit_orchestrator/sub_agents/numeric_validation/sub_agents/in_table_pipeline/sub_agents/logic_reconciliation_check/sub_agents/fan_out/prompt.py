@@ -1,11 +1,13 @@
-"""Prompts for logic reconciliation fan-out (per-table check)."""
+"""Prompts for logic reconciliation fan-out (per-batch check)."""
 
 INSTRUCTION = """
 ### Role
 You are a "Table Logic Reconciliation Formula Inference" agent.
 
 ### Task
-Given a single table, infer formulas for cells derived through **logical interdependencies / rollforward logic** among **non-adjacent, non-sequential, non-contiguous** items inside the SAME table.
+Given one or more tables, infer formulas for cells derived through **logical interdependencies / rollforward logic** among **non-adjacent, non-sequential, non-contiguous** items inside the SAME table.
+
+Each table carries its own `table_index`; a formula only references cells of its target's table.
 
 You do NOT calculate. You only infer relationships and propose formulas that SHOULD apply based on labels and structure.
 
@@ -138,7 +140,10 @@ Closing impairment = Opening impairment + Impairment losses - Reversals - Impair
 Also provide signed-movement variant.
 """
 
+# Only {table_data} differs between candidate-table batches
+_PREFIX, _SUFFIX = INSTRUCTION.split("{table_data}")
+
 
 def get_table_instruction(table_json: str) -> str:
     """Inject table data into the table instruction."""
-    return INSTRUCTION.replace("{table_data}", table_json)
+    return "".join((_PREFIX, table_json, _SUFFIX))
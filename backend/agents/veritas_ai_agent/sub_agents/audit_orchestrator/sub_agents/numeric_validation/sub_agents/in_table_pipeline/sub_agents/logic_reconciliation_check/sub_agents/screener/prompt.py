@@ -12,7 +12,7 @@ Given a JSON list of financial tables, identify which tables likely contain:
 You do NOT compute numbers. You ONLY detect whether the table contains these patterns and output matching table_index values.
 
 ### Input Data
-{extracted_tables}
+{extracted_tables_json}
 
 ### Critical Constraint
 For criterion (2) "non-sequential reconciliation relationship":
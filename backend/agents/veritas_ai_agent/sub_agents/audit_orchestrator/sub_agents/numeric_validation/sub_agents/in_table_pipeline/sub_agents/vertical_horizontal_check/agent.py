@@ -46,6 +46,10 @@ from .prompt import HORIZONTAL_INSTRUCTION, VERTICAL_INSTRUCTION
 from .schema import HorizontalVerticalCheckAgentOutput
 from .utils import chunk_tables
 
+# Shared by every batch: json.dumps() with non-default options builds a new
+# encoder per call, whereas encode() on one instance reuses it.
+_BATCH_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 def _prepare_work_items(state: dict[str, Any]) -> list[list[dict]]:
     """Read extracted tables from state, normalize, and chunk into batches."""
@@ -80,24 +84,23 @@ def _create_check_fan_out_agent(
     name : str
         Agent name (e.g. ``"VerticalCheckAgent"``).
     instruction_template : str
-        Prompt template containing ``{extracted_tables}`` placeholder.
+        Prompt template containing exactly one ``{extracted_tables}`` placeholder.
     output_key : str
         State key for the final aggregated result.
     """
+    # Split once here so each batch is a plain concatenation rather than a
+    # scan of the whole template. (.format() is not an option: the template
+    # contains curly braces for JSON examples.)
+    prefix, suffix = instruction_template.split("{extracted_tables}")
 
     def _create_agent(index: int, work_item: list[dict], output_key: str) -> LlmAgent:
         """Create an LlmAgent for one batch of tables."""
-        batch_json = json.dumps({"tables": work_item}, indent=2)
-        # Note: Using .replace() instead of .format() because the instruction
-        # template contains curly braces for JSON examples which conflict with .format().
-        batch_instruction = instruction_template.replace(
-            "{extracted_tables}", batch_json
-        )
+        batch_json = _BATCH_ENCODER.encode({"tables": work_item})
 
         return LlmAgent(
             name=f"{name}_{index}",
             model=GEMINI_PRO,
-            instruction=batch_instruction,
+            instruction="".join((prefix, batch_json, suffix)),
             output_schema=HorizontalVerticalCheckAgentOutput,
             output_key=output_key,
             on_model_error_callback=default_model_error_handler,
@@ -32,6 +32,7 @@ from .schema import TableNamerOutput
 table_namer_agent = LlmAgent(
     name="TableNamer",
     model=GEMINI_PRO,
+    static_instruction=prompt.STATIC_INSTRUCTION,
     instruction=prompt.INSTRUCTION,
     output_key="table_namer_output",
     output_schema=TableNamerOutput,
@@ -71,6 +71,8 @@ async def after_agent_callback(callback_context: CallbackContext) -> None:
 
     Writes:
         extracted_tables      - final envelope with table_index, name, grid
+        extracted_tables_json - the same envelope as compact JSON, for the
+                                prompts that embed every table
     """
     raw_tables = callback_context.state.get("extracted_tables_raw", {}).get(
         "tables", []
@@ -102,7 +104,13 @@ async def after_agent_callback(callback_context: CallbackContext) -> None:
             }
         )
 
-    callback_context.state["extracted_tables"] = {"tables": merged}
+    envelope = {"tables": merged}
+    callback_context.state["extracted_tables"] = envelope
+    # Serialise once here; every prompt embedding the tables would otherwise
+    # re-render the dict on each model call.
+    callback_context.state["extracted_tables_json"] = json.dumps(
+        envelope, separators=(",", ":"), ensure_ascii=False
+    )
     logger.info("Merged names for %d tables into extracted_tables.", len(merged))
 
 
@@ -1,4 +1,7 @@
-INSTRUCTION = """
+# Sent as the system instruction: identical for every document, so the
+# provider can cache it.  It contains no ``{placeholders}`` because ADK does
+# not template static instructions.
+STATIC_INSTRUCTION = """
 ### Role
 You are a financial-document analyst with expertise in identifying and naming
 tables found in corporate reports.
@@ -11,18 +14,6 @@ You will be given:
 Your ONLY job is to assign a clear, human-readable name to each table by
 analyzing both the table content AND the surrounding markdown context.
 
-### Input Data
-
-#### Full Document (Markdown)
-{document_markdown}
-
-#### Extracted Tables (JSON)
-Each table entry contains:
-  - table_index: 0-based position in document order
-  - grid: A 2D array where the first row is the header, followed by data rows
-
-{extracted_tables_raw}
-
 ### Naming Priority Rules
 1. **Use headings from the markdown**: Look for headings (##, ###) or captions
    that appear immediately before the table in the markdown document. This is
@@ -48,3 +39,18 @@ Example:
 Do not include any explanation, commentary, or markdown fences — just the
 raw JSON array.
 """
+
+# Per-document input, sent as user content after the static instruction.
+INSTRUCTION = """
+### Input Data
+
+#### Full Document (Markdown)
+{document_markdown}
+
+#### Extracted Tables (JSON)
+Each table entry contains:
+  - table_index: 0-based position in document order
+  - grid: A 2D array where the first row is the header, followed by data rows
+
+{extracted_tables_raw}
+"""